@@ -0,0 +1,161 @@
+"""
+controller/_cache.py
+--------------------
+Caches shared by the controllers.
+
+- find_cached(): bounded LRU of detached entities keyed by (entity class, id).
+  Controllers must call invalidate() after changing or removing a record.
+  Misses are not cached, so newly added records are always visible.
+- cached_list(): last find_all_* result per entity class, tagged with a change
+  token. Controllers must call bump() after any successful write to that class;
+  reload=True queries anyway, picking up changes made by other clients.
+- cached_report(): report results reused until any bump() or the date changes
+  (and, if given, a TTL), since report queries compare against CURRENT_DATE.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from model.da import get_dao
+
+MAX_ENTRIES: int = 1024
+
+_entries: "OrderedDict[Tuple[Type, int], Any]" = OrderedDict()
+_versions: Dict[Type, int] = {}
+_lists: Dict[Type, Tuple[int, List[Any]]] = {}
+_reports: Dict[str, Tuple[int, date, float, List[Any]]] = {}
+_report_version: int = 0  # Advanced by every bump(); cached reports carry the value they saw
+_lock = Lock()
+
+
+def find_cached(class_name: Type, id: int) -> Optional[Any]:
+    """
+    Return the entity with the given ID, reading through to the database on a miss.
+
+    Args:
+        class_name (Type): Entity class to look up.
+        id (int): Primary key of the record.
+
+    Returns:
+        Optional[Any]: The entity if found, otherwise None.
+    """
+    key = (class_name, id)
+    with _lock:
+        if key in _entries:
+            _entries.move_to_end(key)
+            return _entries[key]
+
+    entity = get_dao(class_name).find_by_id(id)
+    if entity is not None:
+        with _lock:
+            _entries[key] = entity
+            if len(_entries) > MAX_ENTRIES:
+                _entries.popitem(last=False)
+    return entity
+
+
+def invalidate(class_name: Type, id: int) -> None:
+    """
+    Drop a single cached entity.
+
+    Args:
+        class_name (Type): Entity class of the record.
+        id (int): Primary key of the record.
+    """
+    with _lock:
+        _entries.pop((class_name, id), None)
+
+
+def bump(class_name: Type) -> None:
+    """
+    Advance the change token of an entity class, invalidating its cached list.
+
+    Args:
+        class_name (Type): Entity class that was written to.
+    """
+    with _lock:
+        _versions[class_name] = _versions.get(class_name, 0) + 1
+    invalidate_reports()  # Reports join several tables, so any write can change them
+
+
+def cached_list(
+    class_name: Type, loader: Callable[[], List[Any]], reload: bool = False
+) -> List[Any]:
+    """
+    Return the cached list for an entity class, reloading it if the token moved.
+
+    Args:
+        class_name (Type): Entity class the list belongs to.
+        loader (Callable[[], List[Any]]): Fetches the list from the database.
+        reload (bool): Query even if the cached list is current. Other clients'
+            writes never bump the token, so this also drops the class's cached
+            entities and all cached reports.
+
+    Returns:
+        List[Any]: The cached or freshly loaded list.
+    """
+    if reload:
+        with _lock:
+            for key in [key for key in _entries if key[0] is class_name]:
+                del _entries[key]
+        invalidate_reports()
+    with _lock:
+        version = _versions.get(class_name, 0)
+        hit = _lists.get(class_name)
+    if hit and hit[0] == version and not reload:
+        return hit[1]
+
+    data = loader()
+    with _lock:
+        # Tagged with the token read before loading, so a concurrent bump forces a reload
+        _lists[class_name] = (version, data)
+    return data
+
+
+def cached_report(
+    name: str, ttl: Optional[float], loader: Callable[[], List[Any]]
+) -> List[Any]:
+    """
+    Return a report result loaded today since the last write, reloading it otherwise.
+
+    Args:
+        name (str): Key of the report.
+        ttl (Optional[float]): Maximum age of a reused result in seconds, or None
+            to keep it until the next write.
+        loader (Callable[[], List[Any]]): Runs the report query.
+
+    Returns:
+        List[Any]: The cached or freshly loaded report rows.
+    """
+    now = time.monotonic()
+    today = date.today()
+    with _lock:
+        version = _report_version
+        hit = _reports.get(name)
+    if hit and hit[:2] == (version, today) and (ttl is None or now - hit[2] < ttl):
+        return hit[3]
+
+    data = loader()
+    with _lock:
+        # Tagged with the version read before loading, so a concurrent write forces a reload
+        _reports[name] = (version, today, now, data)
+    return data
+
+
+def invalidate_reports() -> None:
+    """Drop every cached report result."""
+    global _report_version
+    with _lock:
+        _report_version += 1
+        _reports.clear()
+
+
+def clear() -> None:
+    """Drop every cached entity, list and report."""
+    with _lock:
+        _entries.clear()
+        _lists.clear()
+        _reports.clear()
@@ -0,0 +1,51 @@
+"""
+controller/_ops.py
+------------------
+Shared error handling for controller functions.
+
+The controller_op decorator turns a function body that returns its result (or raises)
+into the (status, result or error message) tuple the views expect, logging failures.
+"""
+
+from functools import wraps
+from typing import Any, Callable, Tuple, TypeVar, Union
+from model.tools.logger import Logger
+
+R = TypeVar("R")
+
+
+class NotFoundError(LookupError):
+    """Raised by a controller body when the requested record does not exist."""
+
+
+def controller_op(
+    failure: str,
+) -> Callable[[Callable[..., R]], Callable[..., Tuple[bool, Union[R, str]]]]:
+    """
+    Wrap a controller function in the standard (status, result) contract.
+
+    NotFoundError is logged as a warning, any other exception as an error
+    followed by the failure text; both return (False, str(exception)).
+
+    Args:
+        failure (str): Text appended to error logs, e.g. "Book not saved."
+
+    Returns:
+        Callable: Decorator producing functions that return (True, result) on success.
+    """
+
+    def decorator(func: Callable[..., R]) -> Callable[..., Tuple[bool, Union[R, str]]]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Tuple[bool, Union[R, str]]:
+            try:
+                return True, func(*args, **kwargs)
+            except NotFoundError as e:
+                Logger.warning("%s", e)
+                return False, str(e)
+            except Exception as e:
+                Logger.error("%s - %s", e, failure)
+                return False, str(e)
+
+        return wrapper
+
+    return decorator
@@ -4,16 +4,26 @@ controller/book_controller.py
 Handles the business logic for book records.
 
 Provides functions for creating, editing, deleting, and searching books.
-Each function returns a tuple of status and result (or error message).
+Each function returns a tuple of status and result (or error message);
+the shared controller_op decorator builds that tuple and logs failures.
 All operations are logged using the centralized Logger.
 """
 
-from typing import Tuple, Union, List
+from typing import Tuple, List, Dict, Any, Iterator
 from model.entity import Book, Logger
-from model.da import DataAccess
-
-
-def add_book(title: str, author: str, pages: int) -> Tuple[bool, Union[Book, str]]:
+from model.tools.validators import title_validator, name_validator, amount_validator
+from model.tools.validators_batch import (
+    title_validator_batch,
+    name_validator_batch,
+    amount_validator_batch,
+)
+from model.da import get_dao
+from controller._cache import find_cached, invalidate, bump, cached_list
+from controller._ops import controller_op, NotFoundError
+
+
+@controller_op("Book not saved.")
+def add_book(title: str, author: str, pages: int) -> Book:
     """
     Create and save a new book in the database.
 
@@ -26,21 +36,45 @@ def add_book(title: str, author: str, pages: int) -> Tuple[bool, Union[Book, str
         Tuple[bool, Union[Book, str]]: (True, Book instance) on success,
                                        (False, error message) on failure.
     """
-    try:
-        new_book = Book(title=title, author=author, pages=pages)
-        DataAccess(Book).save(new_book)
-        Logger.info(f"Book {new_book} saved.")
-        return True, new_book
-    except Exception as e:
-        Logger.error(f"{e} - Book not saved.")
-        return False, str(e)
-
-
-def edit_book(
-    id: int, title: str, author: str, pages: int
-) -> Tuple[bool, Union[Book, str]]:
+    new_book = Book(title=title, author=author, pages=pages)
+    get_dao(Book).save(new_book)
+    bump(Book)
+    Logger.info("Book %s saved.", new_book)
+    return new_book
+
+
+@controller_op("Books not saved.")
+def add_books_bulk(rows: List[Dict[str, Any]]) -> int:
+    """
+    Validate and save many books with a single INSERT.
+
+    Columns are validated with the batch validators (same rules as Book),
+    so no Book object is built per row.
+
+    Args:
+        rows (List[Dict[str, Any]]): Dicts with "title", "author" and "pages" keys.
+
+    Returns:
+        Tuple[bool, Union[int, str]]: (True, number of books saved) or (False, error message).
+    """
+    titles = title_validator_batch([row["title"] for row in rows], "Invalid book title!")
+    authors = name_validator_batch([row["author"] for row in rows], "Invalid author name!")
+    pages = amount_validator_batch([row["pages"] for row in rows], "Invalid pages number!")
+    count = get_dao(Book).save_all(
+        [
+            {"_title": t, "_author": a, "_pages": p}
+            for t, a, p in zip(titles, authors, pages)
+        ]
+    )
+    bump(Book)
+    Logger.info("%d books saved.", count)
+    return count
+
+
+@controller_op("Book not edited.")
+def edit_book(id: int, title: str, author: str, pages: int) -> Book:
     """
-    Update an existing book's information.
+    Update an existing book's information with a single UPDATE statement.
 
     Args:
         id (int): ID of the book to update.
@@ -51,18 +85,22 @@ def edit_book(
     Returns:
         Tuple[bool, Union[Book, str]]: (True, updated Book) or (False, error message).
     """
-    try:
-        book = Book(title=title, author=author, pages=pages)
-        book.id = id
-        DataAccess(Book).edit(book)
-        Logger.info(f"Book {book} edited.")
-        return True, book
-    except Exception as e:
-        Logger.error(f"{e} - Book not edited.")
-        return False, str(e)
-
-
-def remove_book_by_id(id: int) -> Tuple[bool, Union[Book, str]]:
+    book = get_dao(Book).update_by_id(
+        id,
+        _title=title_validator(title, "Invalid book title!"),
+        _author=name_validator(author, "Invalid author name!"),
+        _pages=amount_validator(pages, "Invalid pages number!"),
+    )
+    if not book:
+        raise NotFoundError(f"No book found with ID {id}.")
+    invalidate(Book, id)
+    bump(Book)
+    Logger.info("Book %s edited.", book)
+    return book
+
+
+@controller_op("Failed to remove book.")
+def remove_book_by_id(id: int) -> Book:
     """
     Remove a book from the database by its ID.
 
@@ -72,46 +110,58 @@ def remove_book_by_id(id: int) -> Tuple[bool, Union[Book, str]]:
     Returns:
         Tuple[bool, Union[Book, str]]: (True, removed Book) or (False, error message).
     """
-    try:
-        book_dao = DataAccess(Book)
-        book = book_dao.find_by_id(id)
-        if book:
-            book_dao.remove_by_id(id)
-            Logger.info(f"Book with ID {id} removed.")
-            return True, book
-        else:
-            Logger.warning(f"No book found with ID {id}.")
-            return False, f"No book found with ID {id}."
-    except Exception as e:
-        Logger.error(f"{e} - Failed to remove book with ID {id}.")
-        return False, str(e)
-
-
-def find_all_books() -> Tuple[bool, Union[List[Tuple[int, str, str, int]], str]]:
+    book = get_dao(Book).remove_by_id_returning(id)
+    if not book:
+        raise NotFoundError(f"No book found with ID {id}.")
+    invalidate(Book, id)
+    bump(Book)
+    Logger.info("Book with ID %s removed.", id)
+    return book
+
+
+@controller_op("Error while retrieving all books.")
+def find_all_books(reload: bool = False) -> List[Tuple[int, str, str, int]]:
     """
     Retrieve all books from the database.
 
+    The list is cached until the next successful book write.
+
+    Args:
+        reload (bool): Bypass the cache, e.g. for a user-requested refresh.
+
     Returns:
         Tuple[bool, Union[List of tuples or error string]]:
             (True, List of book tuples) or (False, error message).
             Each tuple format: (id, title, author, pages)
     """
-    try:
-        book_list = DataAccess(Book).find_all()
-        result = []
-        for b in book_list:
-            try:
-                result.append((b.id, b.title, b.author, b.pages))
-            except Exception:
-                result.append(("[Error]", "", "", ""))
-        Logger.info(f"{len(result)} books retrieved.")
-        return True, result
-    except Exception as e:
-        Logger.error(f"{e} - Error while retrieving all books.")
-        return False, str(e)
-
-
-def find_book_by_id(id: int) -> Tuple[bool, Union[Book, str]]:
+    result = cached_list(
+        Book,
+        lambda: get_dao(Book).find_all_tuples(
+            Book._id, Book._title, Book._author, Book._pages
+        ),
+        reload,
+    )
+    Logger.info("%d books retrieved.", len(result))
+    return result
+
+
+def find_all_books_iter() -> Iterator[Tuple[int, str, str, int]]:
+    """
+    Stream all books in batches instead of loading the whole table at once.
+
+    Rows are fetched lazily, so database errors surface while iterating
+    rather than being returned as a status tuple.
+
+    Returns:
+        Iterator[Tuple]: Book tuples.
+            Each tuple format: (id, title, author, pages)
+    """
+    Logger.info("Streaming books.")
+    return get_dao(Book).iter_tuples(Book._id, Book._title, Book._author, Book._pages)
+
+
+@controller_op("Error finding book.")
+def find_book_by_id(id: int) -> Book:
     """
     Retrieve a single book by its ID.
 
@@ -121,14 +171,8 @@ def find_book_by_id(id: int) -> Tuple[bool, Union[Book, str]]:
     Returns:
         Tuple[bool, Union[Book, str]]: (True, Book) or (False, error message).
     """
-    try:
-        book = DataAccess(Book).find_by_id(id)
-        if book:
-            Logger.info(f"Book {book} found.")
-            return True, book
-        else:
-            Logger.warning(f"No book found with ID {id}.")
-            return False, f"No book found with ID {id}."
-    except Exception as e:
-        Logger.error(f"{e} - Error finding book with ID {id}.")
-        return False, str(e)
+    book = find_cached(Book, id)
+    if not book:
+        raise NotFoundError(f"No book found with ID {id}.")
+    Logger.info("Book %s found.", book)
+    return book
@@ -5,23 +5,35 @@ Handles the business logic for borrowing records.
 
 This module provides functions to create, edit, delete, and retrieve
 borrow records. It ensures proper validation and interaction between
-members, books, and borrow entries. Logging is performed for all actions.
+members, books, and borrow entries. Failures are turned into
+(False, message) by the shared controller_op decorator.
+Logging is performed for all actions.
 """
 
-from typing import Tuple, Union, List
+from typing import Tuple, Union, List, Dict, Any, Iterator, Iterable
+from collections import defaultdict
 from datetime import date
+from sqlalchemy.exc import IntegrityError
 from model.entity import Member, Book, Borrow, Logger
-from model.da import DataAccess
+from model.tools.validators import amount_validator, date_validator
+from model.tools.validators_batch import amount_validator_batch, date_validator_batch
+from model.da import get_dao
 from model.da.session import get_session
-from sqlalchemy.orm import joinedload
+from controller._cache import find_cached, invalidate, bump, cached_list
+from controller._ops import controller_op, NotFoundError
+from controller.member_controller import find_all_members
+from controller.book_controller import find_all_books
 
 
+@controller_op("Borrow not saved.")
 def add_borrow(
     member_id: int, book_id: int, borrow_date: date, return_date: Union[date, None]
-) -> Tuple[bool, Union[Borrow, str]]:
+) -> Borrow:
     """
     Create and save a new borrow record.
 
+    Member and book are fetched and the borrow is inserted within one session.
+
     Args:
         member_id (int): ID of the borrowing member.
         book_id (int): ID of the borrowed book.
@@ -31,31 +43,66 @@ def add_borrow(
     Returns:
         Tuple[bool, Borrow or error message].
     """
-    try:
-        member = DataAccess(Member).find_by_id(member_id)
-        book = DataAccess(Book).find_by_id(book_id)
+    with get_session() as session:
+        member = session.get(Member, member_id)
+        book = session.get(Book, book_id)
         new_borrow = Borrow(member, book, borrow_date)
         if return_date is not None:
             new_borrow.return_date = return_date
 
-        DataAccess(Borrow).save(new_borrow)
-        Logger.info(f"Borrow {new_borrow} saved.")
-        return True, new_borrow
-    except Exception as e:
-        Logger.error(f"{e} - Borrow not saved.")
-        return False, str(e)
+        session.add(new_borrow)
+        session.flush()
+        session.expunge(new_borrow)
+    bump(Borrow)
+    Logger.info("Borrow %s saved.", new_borrow)
+    return new_borrow
+
+
+@controller_op("Borrows not saved.")
+def add_borrows_bulk(rows: List[Dict[str, Any]]) -> int:
+    """
+    Validate and save many borrow records with a single INSERT.
+
+    Member and book IDs are not looked up; the foreign keys reject unknown IDs.
+
+    Args:
+        rows (List[Dict[str, Any]]): Dicts with "member_id", "book_id", "borrow_date"
+                                     and optional "return_date" keys.
+
+    Returns:
+        Tuple[bool, Union[int, str]]: (True, number of borrows saved) or (False, error message).
+    """
+    member_ids = amount_validator_batch([row["member_id"] for row in rows], "Invalid member id !")
+    book_ids = amount_validator_batch([row["book_id"] for row in rows], "Invalid book id !")
+    borrow_dates = date_validator_batch([row["borrow_date"] for row in rows], "Invalid borrow date!")
+    return_dates = date_validator_batch(
+        [row.get("return_date") for row in rows], "Invalid return date!", allow_none=True
+    )
+    count = get_dao(Borrow).save_all(
+        [
+            {"_member_id": m, "_book_id": b, "_borrow_date": bd, "_return_date": rd}
+            for m, b, bd, rd in zip(member_ids, book_ids, borrow_dates, return_dates)
+        ]
+    )
+    bump(Borrow)
+    Logger.info("%d borrows saved.", count)
+    return count
 
 
+@controller_op("Borrow not edited.")
 def edit_borrow(
     id: int,
     member_id: int,
     book_id: int,
     borrow_date: date,
     return_date: Union[date, None]
-) -> Tuple[bool, Union[Borrow, str]]:
+) -> Borrow:
     """
     Edit an existing borrow record.
 
+    Issued as a single UPDATE; the foreign keys reject unknown member/book IDs,
+    which are reported as NotFoundError like an unknown borrow ID.
+
     Args:
         id (int): ID of the borrow to update.
         member_id (int): Updated member ID.
@@ -67,22 +114,34 @@ def edit_borrow(
         Tuple[bool, Borrow or error message].
     """
     try:
-        member = DataAccess(Member).find_by_id(member_id)
-        book = DataAccess(Book).find_by_id(book_id)
-        updated_borrow = Borrow(member, book, borrow_date)
-        updated_borrow.id = id
-        if return_date:
-            updated_borrow.return_date = return_date
-
-        DataAccess(Borrow).edit(updated_borrow)
-        Logger.info(f"Borrow {updated_borrow} edited.")
-        return True, updated_borrow
-    except Exception as e:
-        Logger.error(f"{e} - Borrow not edited.")
-        return False, str(e)
+        updated_borrow = get_dao(Borrow).update_by_id(
+            id,
+            _member_id=amount_validator(member_id, "Invalid member id !"),
+            _book_id=amount_validator(book_id, "Invalid book id !"),
+            _borrow_date=date_validator(borrow_date, "Invalid borrow date!"),
+            _return_date=(
+                date_validator(return_date, "Invalid return date!")
+                if return_date
+                else None
+            ),
+        )
+    except IntegrityError as e:
+        constraint = getattr(getattr(e.orig, "diag", None), "constraint_name", None) or ""
+        if "_member_id" in constraint:
+            raise NotFoundError(f"No member found with ID {member_id}.") from e
+        if "_book_id" in constraint:
+            raise NotFoundError(f"No book found with ID {book_id}.") from e
+        raise
+    if not updated_borrow:
+        raise NotFoundError(f"No borrow found with ID {id}.")
+    invalidate(Borrow, id)
+    bump(Borrow)
+    Logger.info("Borrow %s edited.", updated_borrow)
+    return updated_borrow
 
 
-def remove_borrow_by_id(id: int) -> Tuple[bool, Union[Borrow, str]]:
+@controller_op("Failed to remove borrow.")
+def remove_borrow_by_id(id: int) -> Borrow:
     """
     Delete a borrow record by ID.
 
@@ -92,54 +151,98 @@ def remove_borrow_by_id(id: int) -> Tuple[bool, Union[Borrow, str]]:
     Returns:
         Tuple[bool, Borrow or error message].
     """
-    try:
-        dao = DataAccess(Borrow)
-        borrow = dao.find_by_id(id)
-        if borrow:
-            dao.remove_by_id(id)
-            Logger.info(f"Borrow with ID {id} removed.")
-            return True, borrow
-        else:
-            Logger.warning(f"No borrow found with ID {id}.")
-            return False, f"No borrow found with ID {id}."
-    except Exception as e:
-        Logger.error(f"{e} - Failed to remove borrow with ID {id}.")
-        return False, str(e)
+    borrow = get_dao(Borrow).remove_by_id_returning(id)
+    if not borrow:
+        raise NotFoundError(f"No borrow found with ID {id}.")
+    invalidate(Borrow, id)
+    bump(Borrow)
+    Logger.info("Borrow with ID %s removed.", id)
+    return borrow
 
 
-def find_all_borrows() -> Tuple[bool, Union[List[Tuple[int, int, int, date, Union[date, None]]], str]]:
+@controller_op("Error retrieving borrows.")
+def find_all_borrows(
+    reload: bool = False,
+) -> List[Tuple[int, int, int, date, Union[date, None]]]:
     """
-    Retrieve all borrow records, with member and book details loaded.
+    Retrieve all borrow records as plain column tuples.
+
+    Only the borrow columns are selected, so no Borrow, Member, or Book
+    objects are built. The list is cached until the next successful borrow write.
+
+    Args:
+        reload (bool): Bypass the cache, e.g. for a user-requested refresh.
 
     Returns:
         Tuple[bool, List of borrow tuples or error string].
         Each tuple contains: (borrow_id, member_id, book_id, borrow_date, return_date)
     """
-    try:
-        with get_session() as session:
-            borrows = (
-                session.query(Borrow)
-                .options(joinedload(Borrow.member), joinedload(Borrow.book))
-                .all()
-            )
-
-            data = []
-            for b in borrows:
-                try:
-                    data.append(
-                        (b.id, b.member.id, b.book.id, b.borrow_date, b.return_date)
-                    )
-                except Exception:
-                    data.append(("[Error]", "", "", "", ""))
-
-            Logger.info(f"{len(data)} borrows retrieved.")
-            return True, data
-    except Exception as e:
-        Logger.error(f"{e} - Error retrieving borrows.")
-        return False, str(e)
-
-
-def find_borrow_by_id(id: int) -> Tuple[bool, Union[Borrow, str]]:
+    data = cached_list(
+        Borrow,
+        lambda: get_dao(Borrow).find_all_tuples(
+            Borrow._id,
+            Borrow._member_id,
+            Borrow._book_id,
+            Borrow._borrow_date,
+            Borrow._return_date,
+        ),
+        reload,
+    )
+    Logger.info("%d borrows retrieved.", len(data))
+    return data
+
+
+@controller_op("Error while loading borrow form data.")
+def find_borrow_view_bundle(reload: bool = False) -> Tuple[
+    List[Tuple[int, int, int, date, Union[date, None]]],
+    List[Tuple[int, str, str]],
+    List[Tuple[int, str, str, int]],
+]:
+    """
+    Retrieve everything the borrow form shows: borrows, members, and books.
+
+    The three lists come from the same caches as find_all_borrows, find_all_members
+    and find_all_books; whichever are stale are queried inside one session, so they
+    share a single connection checkout and transaction.
+
+    Args:
+        reload (bool): Bypass the caches, e.g. for a user-requested refresh.
+
+    Returns:
+        Tuple[bool, Union[Tuple[list, list, list], str]]:
+            (True, (borrows, members, books)) or (False, error message).
+    """
+    with get_session():
+        # __wrapped__ is the undecorated body, so a failure propagates to this function
+        borrows = find_all_borrows.__wrapped__(reload)
+        members = find_all_members.__wrapped__(reload)
+        books = find_all_books.__wrapped__(reload)
+    return borrows, members, books
+
+
+def find_all_borrows_iter() -> Iterator[Tuple[int, int, int, date, Union[date, None]]]:
+    """
+    Stream all borrows in batches instead of loading the whole table at once.
+
+    Rows are fetched lazily, so database errors surface while iterating
+    rather than being returned as a status tuple.
+
+    Returns:
+        Iterator[Tuple]: Borrow tuples.
+            Each tuple format: (borrow_id, member_id, book_id, borrow_date, return_date)
+    """
+    Logger.info("Streaming borrows.")
+    return get_dao(Borrow).iter_tuples(
+        Borrow._id,
+        Borrow._member_id,
+        Borrow._book_id,
+        Borrow._borrow_date,
+        Borrow._return_date,
+    )
+
+
+@controller_op("Borrow not found.")
+def find_borrow_by_id(id: int) -> Borrow:
     """
     Retrieve a single borrow record by ID.
 
@@ -149,14 +252,50 @@ def find_borrow_by_id(id: int) -> Tuple[bool, Union[Borrow, str]]:
     Returns:
         Tuple[bool, Borrow or error message].
     """
-    try:
-        borrow = DataAccess(Borrow).find_by_id(id)
-        if borrow:
-            Logger.info(f"Borrow {borrow} found.")
-            return True, borrow
-        else:
-            Logger.warning(f"No borrow found with ID {id}.")
-            return False, f"No borrow found with ID {id}."
-    except Exception as e:
-        Logger.error(f"{e} - Borrow not found.")
-        return False, str(e)
+    borrow = find_cached(Borrow, id)
+    if not borrow:
+        raise NotFoundError(f"No borrow found with ID {id}.")
+    Logger.info("Borrow %s found.", borrow)
+    return borrow
+
+
+@controller_op("Error retrieving borrows by member.")
+def find_borrows_by_member_ids(member_ids: Iterable[int]) -> Dict[int, List[Borrow]]:
+    """
+    Retrieve the borrow records of many members with a single IN query.
+
+    Args:
+        member_ids (Iterable[int]): IDs of the members to look up.
+
+    Returns:
+        Tuple[bool, Dict of member_id -> list of Borrow, or error message].
+        Members without borrows are absent from the dict.
+    """
+    ids = set(member_ids)
+    borrows = get_dao(Borrow).find_all_by(Borrow._member_id.in_(ids)) if ids else []
+    result: Dict[int, List[Borrow]] = defaultdict(list)
+    for b in borrows:
+        result[b._member_id].append(b)
+    Logger.info("%d borrows retrieved for %d members.", len(borrows), len(ids))
+    return dict(result)
+
+
+@controller_op("Error retrieving borrows by book.")
+def find_borrows_by_book_ids(book_ids: Iterable[int]) -> Dict[int, List[Borrow]]:
+    """
+    Retrieve the borrow records of many books with a single IN query.
+
+    Args:
+        book_ids (Iterable[int]): IDs of the books to look up.
+
+    Returns:
+        Tuple[bool, Dict of book_id -> list of Borrow, or error message].
+        Books without borrows are absent from the dict.
+    """
+    ids = set(book_ids)
+    borrows = get_dao(Borrow).find_all_by(Borrow._book_id.in_(ids)) if ids else []
+    result: Dict[int, List[Borrow]] = defaultdict(list)
+    for b in borrows:
+        result[b._book_id].append(b)
+    Logger.info("%d borrows retrieved for %d books.", len(borrows), len(ids))
+    return dict(result)
@@ -4,15 +4,21 @@ controller/member_controller.py
 Handles business logic related to Member entities.
 
 Provides CRUD operations and lookup functionality for members.
+Failures are turned into (False, message) by the shared controller_op decorator.
 All operations are logged via a shared Logger instance.
 """
 
-from typing import Tuple, Union, List
+from typing import Tuple, List, Dict, Any, Iterator
 from model.entity import Member, Logger
-from model.da import DataAccess
+from model.tools.validators import name_validator
+from model.tools.validators_batch import name_validator_batch
+from model.da import get_dao
+from controller._cache import find_cached, invalidate, bump, cached_list
+from controller._ops import controller_op, NotFoundError
 
 
-def add_member(name: str, family: str) -> Tuple[bool, Union[Member, str]]:
+@controller_op("Member not saved.")
+def add_member(name: str, family: str) -> Member:
     """
     Create and save a new member.
 
@@ -24,19 +30,41 @@ def add_member(name: str, family: str) -> Tuple[bool, Union[Member, str]]:
         Tuple[bool, Union[Member, str]]: (True, Member) on success,
                                          (False, error message) on failure.
     """
-    try:
-        new_member = Member(name=name, family=family)
-        DataAccess(Member).save(new_member)
-        Logger.info(f"Member {new_member} saved.")
-        return True, new_member
-    except Exception as e:
-        Logger.error(f"{e} - Member not saved.")
-        return False, str(e)
+    new_member = Member(name=name, family=family)
+    get_dao(Member).save(new_member)
+    bump(Member)
+    Logger.info("Member %s saved.", new_member)
+    return new_member
 
 
-def edit_member(id: int, name: str, family: str) -> Tuple[bool, Union[Member, str]]:
+@controller_op("Members not saved.")
+def add_members_bulk(rows: List[Dict[str, Any]]) -> int:
     """
-    Update an existing member by ID.
+    Validate and save many members with a single INSERT.
+
+    Columns are validated with the batch validators (same rules as Member),
+    so no Member object is built per row.
+
+    Args:
+        rows (List[Dict[str, Any]]): Dicts with "name" and "family" keys.
+
+    Returns:
+        Tuple[bool, Union[int, str]]: (True, number of members saved) or (False, error message).
+    """
+    names = name_validator_batch([row["name"] for row in rows], "Invalid name!")
+    families = name_validator_batch([row["family"] for row in rows], "Invalid family!")
+    count = get_dao(Member).save_all(
+        [{"_name": n, "_family": f} for n, f in zip(names, families)]
+    )
+    bump(Member)
+    Logger.info("%d members saved.", count)
+    return count
+
+
+@controller_op("Member not edited.")
+def edit_member(id: int, name: str, family: str) -> Member:
+    """
+    Update an existing member by ID with a single UPDATE statement.
 
     Args:
         id (int): Member ID.
@@ -46,18 +74,21 @@ def edit_member(id: int, name: str, family: str) -> Tuple[bool, Union[Member, st
     Returns:
         Tuple[bool, Union[Member, str]]: (True, updated Member) or (False, error message).
     """
-    try:
-        updated_member = Member(name=name, family=family)
-        updated_member.id = id
-        DataAccess(Member).edit(updated_member)
-        Logger.info(f"Member {updated_member} edited.")
-        return True, updated_member
-    except Exception as e:
-        Logger.error(f"{e} - Member not edited.")
-        return False, str(e)
-
-
-def remove_member_by_id(id: int) -> Tuple[bool, Union[Member, str]]:
+    updated_member = get_dao(Member).update_by_id(
+        id,
+        _name=name_validator(name, "Invalid name!"),
+        _family=name_validator(family, "Invalid family!"),
+    )
+    if not updated_member:
+        raise NotFoundError(f"No member found with ID {id}.")
+    invalidate(Member, id)
+    bump(Member)
+    Logger.info("Member %s edited.", updated_member)
+    return updated_member
+
+
+@controller_op("Failed to remove member.")
+def remove_member_by_id(id: int) -> Member:
     """
     Delete a member by ID.
 
@@ -67,46 +98,58 @@ def remove_member_by_id(id: int) -> Tuple[bool, Union[Member, str]]:
     Returns:
         Tuple[bool, Union[Member, str]]: (True, removed Member) or (False, error message).
     """
-    try:
-        dao = DataAccess(Member)
-        member = dao.find_by_id(id)
-        if member:
-            dao.remove_by_id(id)
-            Logger.info(f"Member with ID {id} removed.")
-            return True, member
-        else:
-            Logger.warning(f"No member found with ID {id}.")
-            return False, f"No member found with ID {id}."
-    except Exception as e:
-        Logger.error(f"{e} - Failed to remove member with ID {id}.")
-        return False, str(e)
+    member = get_dao(Member).remove_by_id_returning(id)
+    if not member:
+        raise NotFoundError(f"No member found with ID {id}.")
+    invalidate(Member, id)
+    bump(Member)
+    Logger.info("Member with ID %s removed.", id)
+    return member
 
 
-def find_all_members() -> Tuple[bool, Union[List[Tuple[int, str, str]], str]]:
+@controller_op("Error retrieving all members.")
+def find_all_members(reload: bool = False) -> List[Tuple[int, str, str]]:
     """
     Retrieve all members from the database.
 
+    The list is cached until the next successful member write.
+
+    Args:
+        reload (bool): Bypass the cache, e.g. for a user-requested refresh.
+
     Returns:
         Tuple[bool, Union[List[Tuple], str]]:
             (True, list of member tuples) or (False, error message).
             Each tuple is: (id, name, family)
     """
-    try:
-        members = DataAccess(Member).find_all()
-        result = []
-        for m in members:
-            try:
-                result.append((m.id, m.name, m.family))
-            except Exception:
-                result.append(("[Error]", "", ""))
-        Logger.info(f"{len(result)} members retrieved.")
-        return True, result
-    except Exception as e:
-        Logger.error(f"{e} - Error retrieving all members.")
-        return False, str(e)
+    result = cached_list(
+        Member,
+        lambda: get_dao(Member).find_all_tuples(
+            Member._id, Member._name, Member._family
+        ),
+        reload,
+    )
+    Logger.info("%d members retrieved.", len(result))
+    return result
+
+
+def find_all_members_iter() -> Iterator[Tuple[int, str, str]]:
+    """
+    Stream all members in batches instead of loading the whole table at once.
+
+    Rows are fetched lazily, so database errors surface while iterating
+    rather than being returned as a status tuple.
+
+    Returns:
+        Iterator[Tuple]: Member tuples.
+            Each tuple format: (id, name, family)
+    """
+    Logger.info("Streaming members.")
+    return get_dao(Member).iter_tuples(Member._id, Member._name, Member._family)
 
 
-def find_member_by_id(id: int) -> Tuple[bool, Union[Member, str]]:
+@controller_op("Error finding member.")
+def find_member_by_id(id: int) -> Member:
     """
     Retrieve a member by their ID.
 
@@ -116,20 +159,15 @@ def find_member_by_id(id: int) -> Tuple[bool, Union[Member, str]]:
     Returns:
         Tuple[bool, Union[Member, str]]: (True, Member) or (False, error message).
     """
-    try:
-        member = DataAccess(Member).find_by_id(id)
-        if member:
-            Logger.info(f"Member {member} found.")
-            return True, member
-        else:
-            Logger.warning(f"No member found with ID {id}.")
-            return False, f"No member found with ID {id}."
-    except Exception as e:
-        Logger.error(f"{e} - Error finding member with ID {id}.")
-        return False, str(e)
+    member = find_cached(Member, id)
+    if not member:
+        raise NotFoundError(f"No member found with ID {id}.")
+    Logger.info("Member %s found.", member)
+    return member
 
 
-def find_members_by_family(family: str) -> Tuple[bool, Union[List[Member], str]]:
+@controller_op("Error finding members by family.")
+def find_members_by_family(family: str) -> List[Member]:
     """
     Find all members with a matching family name.
 
@@ -139,14 +177,8 @@ def find_members_by_family(family: str) -> Tuple[bool, Union[List[Member], str]]
     Returns:
         Tuple[bool, Union[List[Member], str]]: (True, list of members) or (False, error message).
     """
-    try:
-        members = DataAccess(Member).find_all_by(Member._family == family)
-        if members:
-            Logger.info(f"{len(members)} members found with family name '{family}'.")
-            return True, members
-        else:
-            Logger.warning(f"No members found with family name '{family}'.")
-            return False, f"No members found with family name '{family}'."
-    except Exception as e:
-        Logger.error(f"{e} - Error finding members by family '{family}'.")
-        return False, str(e)
+    members = get_dao(Member).find_all_by(Member._family == family)
+    if not members:
+        raise NotFoundError(f"No members found with family name '{family}'.")
+    Logger.info("%d members found with family name '%s'.", len(members), family)
+    return members
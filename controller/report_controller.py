@@ -12,14 +12,55 @@ Reports include:
 - Members who never borrowed
 - All borrow records
 - Borrow count per book
+
+Results are reused until a controller write changes the data or the date
+changes, since delays are counted from CURRENT_DATE (REPORT_TTL, if set, also
+bounds their age). A failing report query is logged and its exception
+re-raised, so the UI can report the failure instead of showing an empty table.
 """
 
-from typing import List, Tuple
-from datetime import date
+from functools import wraps
+from typing import Callable, Iterator, List, Optional, Tuple
+from model.entity import Logger
+from model.da.config import Session
 from model.da.session import get_session
 from model.da.reports import *
+from controller._cache import cached_report
+
+REPORT_TTL: Optional[float] = None  # No time limit: only writes and a new day make reports stale
+
+
+def cached_report_result(
+    seconds: Optional[float],
+) -> Callable[[Callable[[], List[Tuple]]], Callable[[], List[Tuple]]]:
+    """
+    Reuse a report function's result until the next write or the next day.
+
+    A failing query is logged and its exception re-raised, so callers can tell a
+    database error from an empty report; failures are never cached.
 
+    Args:
+        seconds (Optional[float]): Maximum age of a reused result, or None for no limit.
+
+    Returns:
+        Callable: Decorator caching the result under the function's name.
+    """
 
+    def decorator(func: Callable[[], List[Tuple]]) -> Callable[[], List[Tuple]]:
+        @wraps(func)
+        def wrapper() -> List[Tuple]:
+            try:
+                return cached_report(func.__name__, seconds, func)
+            except Exception as e:
+                Logger.error("%s - Report %s failed.", e, func.__name__)
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+@cached_report_result(REPORT_TTL)
 def get_currently_borrowed_info() -> List[Tuple]:
     """
     Retrieve a list of currently borrowed books with borrower details.
@@ -27,26 +68,10 @@ def get_currently_borrowed_info() -> List[Tuple]:
     :return: List of tuples → (book_id, title, member_id, first_name, last_name, borrow_date)
     """
     with get_session() as session:
-        borrows = get_current_borrows_with_details(session)
-        data = []
-
-        for b in borrows:
-            try:
-                data.append(
-                    (
-                        b.book.id,
-                        b.book.title,
-                        b.member.id,
-                        b.member.name,
-                        b.member.family,
-                        b.borrow_date.strftime("%Y-%m-%d") if b.borrow_date else "-",
-                    )
-                )
-            except Exception:
-                data.append(("[Error]", "", "", "", "", ""))
-        return data
+        return get_current_borrows_with_details(session)
 
 
+@cached_report_result(REPORT_TTL)
 def get_books_never_borrowed_info() -> List[Tuple]:
     """
     Retrieve books that have never been borrowed.
@@ -54,17 +79,10 @@ def get_books_never_borrowed_info() -> List[Tuple]:
     :return: List of tuples → (book_id, title, author)
     """
     with get_session() as session:
-        books = get_books_never_borrowed(session)
-        data = []
-
-        for book in books:
-            try:
-                data.append((book.id, book.title, book.author))
-            except Exception:
-                data.append(("[Error]", "", ""))
-        return data
+        return get_books_never_borrowed(session)
 
 
+@cached_report_result(REPORT_TTL)
 def get_members_with_unreturned_info() -> List[Tuple]:
     """
     Get members who have unreturned books and the delay in days.
@@ -72,21 +90,10 @@ def get_members_with_unreturned_info() -> List[Tuple]:
     :return: List of tuples → (member_id, first_name, last_name, book_title, delay_days)
     """
     with get_session() as session:
-        borrows = get_members_with_unreturned_books(session)
-        data = []
-        today = date.today()
-
-        for b in borrows:
-            try:
-                delay = (today - b.borrow_date).days
-                data.append(
-                    (b.member.id, b.member.name, b.member.family, b.book.title, delay)
-                )
-            except Exception:
-                data.append(("[Error]", "", "", "", ""))
-        return data
+        return get_members_with_unreturned_books(session)
 
 
+@cached_report_result(REPORT_TTL)
 def get_members_never_borrowed_info() -> List[Tuple]:
     """
     Get members who have never borrowed a book.
@@ -94,17 +101,10 @@ def get_members_never_borrowed_info() -> List[Tuple]:
     :return: List of tuples → (member_id, first_name, last_name)
     """
     with get_session() as session:
-        members = get_members_never_borrowed(session)
-        data = []
-
-        for m in members:
-            try:
-                data.append((m.id, m.name, m.family))
-            except Exception:
-                data.append(("[Error]", "", ""))
-        return data
+        return get_members_never_borrowed(session)
 
 
+@cached_report_result(REPORT_TTL)
 def get_report_all_borrows_info() -> List[Tuple]:
     """
     Retrieve all borrow records with member and book info.
@@ -112,28 +112,24 @@ def get_report_all_borrows_info() -> List[Tuple]:
     :return: List of tuples → (member_id, first_name, last_name, book_id, title, author, borrow_date, return_date)
     """
     with get_session() as session:
-        borrows = get_report_all_borrows(session)
-        data = []
+        return get_report_all_borrows(session)
 
-        for b in borrows:
-            try:
-                data.append(
-                    (
-                        b.member.id,
-                        b.member.name,
-                        b.member.family,
-                        b.book.id,
-                        b.book.title,
-                        b.book.author,
-                        b.borrow_date,
-                        b.return_date,
-                    )
-                )
-            except Exception:
-                data.append(("[Error]", "", "", "", "", "", "", ""))
-        return data
 
+def get_report_all_borrows_iter(batch_size: int = 1000) -> Iterator[Tuple]:
+    """
+    Stream all borrow records instead of loading the whole history at once.
+
+    Not cached; uses its own session, closed when the iterator is exhausted
+    or garbage-collected. Database errors surface while iterating.
+
+    :param batch_size: Rows fetched per round-trip from a server-side cursor.
+    :return: Iterator of tuples in the get_report_all_borrows_info() format
+    """
+    with Session() as session:
+        yield from iter_report_all_borrows(session, batch_size)
 
+
+@cached_report_result(REPORT_TTL)
 def get_book_borrow_counts_info() -> List[Tuple]:
     """
     Get a list of books along with the number of times they were borrowed.
@@ -141,12 +137,4 @@ def get_book_borrow_counts_info() -> List[Tuple]:
     :return: List of tuples → (book_id, title, author, borrow_count)
     """
     with get_session() as session:
-        results = get_book_borrow_counts(session)
-        data = []
-
-        for row in results:
-            try:
-                data.append((row[0], row[1], row[2], row[3]))
-            except Exception:
-                data.append(("[Error]", "", "", ""))
-        return data
+        return get_book_borrow_counts(session)
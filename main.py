@@ -5,9 +5,13 @@ Entry point for the Library Management System.
 It initializes and runs the main application window.
 """
 
+from model.tools.logger import Logger
 from view.main_window_launcher import MainApplication
 
 
 if __name__ == "__main__":
+    # Set up the log handlers once, before the UI can log anything
+    Logger.configure()
+
     # Start the main application
     ui = MainApplication()
@@ -11,7 +11,7 @@ It abstracts the low-level database interactions using SQLAlchemy and exposes:
 Modules included:
 - config         : Database configuration and initialization
 - session        : Session manager with context control
-- base_access    : Generic DataAccess class for CRUD operations
+- base_access    : Generic DataAccess class and shared get_dao() factory
 - reports        : Report-specific advanced queries for analytics
 
 Usage Example:
@@ -25,7 +25,7 @@ from model.da.config import DB_CONFIG, initialize_database
 from model.da.session import get_session
 
 # Core Data Access
-from model.da.base_access import DataAccess
+from model.da.base_access import DataAccess, get_dao
 
 # Reporting Utilities
 from model.da.reports import (
@@ -5,12 +5,21 @@ Provides generic CRUD operations for any SQLAlchemy model entity.
 
 Uses context-managed SQLAlchemy sessions to perform safe and transactional access.
 Supports typical operations such as save, edit, delete, find by ID, and filtering.
+Writes flush instead of committing, so they join any enclosing get_session() transaction.
+DAO instances are stateless, so get_dao() hands out one shared instance per entity class.
+List results are not expunged one by one: sessions do not expire on commit, so the
+entities keep their loaded state once the outermost get_session() closes the session.
 """
 
-from typing import Type, TypeVar, Generic, List, Optional, Any
-from sqlalchemy.orm import joinedload
+from functools import lru_cache
+from typing import Type, TypeVar, Generic, List, Optional, Any, Tuple, Dict, Iterable, Iterator
+from sqlalchemy import delete, insert, inspect, lambda_stmt, select, update
+from sqlalchemy.orm import raiseload
+from model.da.config import Session
 from model.da.session import get_session
 
+__all__ = ["DataAccess", "get_dao"]
+
 T = TypeVar("T")  # SQLAlchemy entity type
 
 
@@ -46,11 +55,50 @@ class DataAccess(Generic[T]):
         """
         with get_session() as session:
             session.add(entity)
-            session.commit()
+            session.flush()
             session.refresh(entity)
             session.expunge(entity)
             return entity
 
+    def save_all(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many records with a single multi-row INSERT.
+
+        Rows are not validated here; callers pass already-validated values.
+
+        Args:
+            rows (List[Dict[str, Any]]): Column values keyed by mapped attribute name.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        if not rows:
+            return 0
+        with get_session() as session:
+            session.execute(insert(self.class_name), rows)
+        return len(rows)
+
+    def save_all_returning(self, rows: List[Dict[str, Any]]) -> List[T]:
+        """
+        Insert many records with a batched INSERT ... RETURNING and return them.
+
+        Like save_all(), but the inserted entities (with generated IDs) come back
+        from the same statement, in the order of rows.
+
+        Args:
+            rows (List[Dict[str, Any]]): Column values keyed by mapped attribute name.
+
+        Returns:
+            List[T]: The inserted entities.
+        """
+        if not rows:
+            return []
+        with get_session() as session:
+            return session.scalars(
+                insert(self.class_name).returning(self.class_name, sort_by_parameter_order=True),
+                rows,
+            ).all()
+
     def edit(self, entity: T) -> T:
         """
         Update an existing entity in the database.
@@ -63,9 +111,34 @@ class DataAccess(Generic[T]):
         """
         with get_session() as session:
             session.merge(entity)
-            session.commit()
+            session.flush()
             return entity
 
+    def update_by_id(self, entity_id: int, **fields: Any) -> Optional[T]:
+        """
+        Update columns of a record with a single UPDATE ... RETURNING statement.
+
+        No entity is built or merged beforehand; fields are not validated here.
+
+        Args:
+            entity_id (int): The ID of the entity to update.
+            **fields (Any): New values keyed by mapped attribute name (e.g. _title=...).
+
+        Returns:
+            Optional[T]: The updated entity (detached) if the row exists, otherwise None.
+        """
+        primary_key = inspect(self.class_name).primary_key[0]
+        with get_session() as session:
+            updated: Optional[T] = session.execute(
+                update(self.class_name)
+                .where(primary_key == entity_id)
+                .values(**fields)
+                .returning(self.class_name)
+            ).scalar_one_or_none()
+            if updated:
+                session.expunge(updated)
+            return updated
+
     def remove(self, entity: T) -> Optional[T]:
         """
         Delete an entity using its instance.
@@ -80,7 +153,7 @@ class DataAccess(Generic[T]):
             found: Optional[T] = session.get(self.class_name, entity.id)
             if found:
                 session.delete(found)
-                session.commit()
+                session.flush()
                 return found
         return None
 
@@ -98,22 +171,91 @@ class DataAccess(Generic[T]):
             found: Optional[T] = session.get(self.class_name, entity_id)
             if found:
                 session.delete(found)
-                session.commit()
+                session.flush()
                 return found
         return None
 
-    def find_all(self) -> List[T]:
+    def remove_by_id_returning(self, entity_id: int) -> Optional[T]:
+        """
+        Delete an entity by its primary key in a single DELETE ... RETURNING statement.
+
+        Args:
+            entity_id (int): The ID of the entity to delete.
+
+        Returns:
+            Optional[T]: The deleted entity (detached) if a row was removed, otherwise None.
+        """
+        primary_key = inspect(self.class_name).primary_key[0]
+        with get_session() as session:
+            found: Optional[T] = session.execute(
+                delete(self.class_name)
+                .where(primary_key == entity_id)
+                .returning(self.class_name)
+            ).scalar_one_or_none()
+            if found:
+                session.expunge(found)
+            return found
+
+    def find_all(self, *load_options: Any) -> List[T]:
         """
         Retrieve all records of the entity from the database.
 
+        Relationships are not loaded: by default any access to one raises instead of
+        lazy-loading. Pass loader options (e.g. selectinload(...)) to eager-load them.
+
+        Args:
+            *load_options (Any): Loader options replacing the default raiseload("*").
+
         Returns:
             List[T]: A list of all entity instances.
         """
+        class_name = self.class_name
+        if load_options:
+            stmt = select(class_name).options(*load_options)
+        else:
+            # lambda_stmt caches the built statement per entity class
+            stmt = lambda_stmt(lambda: select(class_name).options(raiseload("*")))
         with get_session() as session:
-            entities: List[T] = session.query(self.class_name).all()
-            for entity in entities:
-                session.expunge(entity)
-            return entities
+            return session.execute(stmt).scalars().all()
+
+    def find_all_tuples(self, *columns: Any) -> List[Tuple[Any, ...]]:
+        """
+        Retrieve selected columns of every record as plain tuples.
+
+        Skips ORM instance construction, which makes it suitable for read-only lists.
+        The statement is built through lambda_stmt, so repeated calls reuse it.
+
+        Args:
+            *columns (Any): Mapped columns to select (e.g. Model._id, Model._title).
+
+        Returns:
+            List[Tuple[Any, ...]]: One tuple per row, in column order.
+        """
+        with get_session() as session:
+            rows = session.execute(lambda_stmt(lambda: select(*columns))).all()
+            return [tuple(row) for row in rows]
+
+    def iter_tuples(self, *columns: Any, batch_size: int = 1000) -> Iterator[Tuple[Any, ...]]:
+        """
+        Stream selected columns of every record, fetching batch_size rows at a time.
+
+        Uses its own session (not the shared get_session() scope) so an abandoned
+        iterator cannot leave the thread's session open; it is closed when the
+        iterator is exhausted or garbage-collected.
+
+        Args:
+            *columns (Any): Mapped columns to select (e.g. Model._id, Model._title).
+            batch_size (int): Rows fetched per round-trip from a server-side cursor.
+
+        Yields:
+            Tuple[Any, ...]: One tuple per row, in column order.
+        """
+        with Session() as session:
+            result = session.execute(
+                select(*columns).execution_options(yield_per=batch_size)
+            )
+            for row in result:
+                yield tuple(row)
 
     def find_by_id(self, id: int) -> Optional[T]:
         """
@@ -131,18 +273,55 @@ class DataAccess(Generic[T]):
                 session.expunge(entity)
             return entity
 
-    def find_all_by(self, condition: Any) -> List[T]:
+    def find_all_by(self, condition: Any, *load_options: Any) -> List[T]:
         """
         Find all entities matching a given SQLAlchemy condition.
 
+        Relationships follow the same raiseload("*") default as find_all().
+
         Args:
             condition (Any): SQLAlchemy filter expression (e.g. Model.field == value).
+            *load_options (Any): Loader options replacing the default raiseload("*").
 
         Returns:
             List[T]: List of matching entity instances.
         """
+        options = load_options or (raiseload("*"),)
         with get_session() as session:
-            entities: List[T] = session.query(self.class_name).filter(condition).all()
-            for entity in entities:
-                session.expunge(entity)
-            return entities
+            return session.query(self.class_name).options(*options).filter(condition).all()
+
+    def find_all_by_ids(self, ids: Iterable[int], *load_options: Any) -> List[T]:
+        """
+        Find all entities whose primary key is in ids with a single IN query.
+
+        Use instead of calling find_by_id() or find_all_by() once per ID in a loop.
+        Relationships follow the same raiseload("*") default as find_all().
+
+        Args:
+            ids (Iterable[int]): Primary keys to look up; unknown IDs are skipped.
+            *load_options (Any): Loader options replacing the default raiseload("*").
+
+        Returns:
+            List[T]: Matching entity instances, in no particular order.
+        """
+        id_list = list(ids)
+        if not id_list:
+            return []
+        primary_key = inspect(self.class_name).primary_key[0]
+        return self.find_all_by(primary_key.in_(id_list), *load_options)
+
+
+@lru_cache(maxsize=None)
+def get_dao(class_name: Type[T]) -> DataAccess[T]:
+    """
+    Return the shared DataAccess instance for an entity class.
+
+    The DAO is built on first request and reused by every later call.
+
+    Args:
+        class_name (Type[T]): The SQLAlchemy entity class to operate on.
+
+    Returns:
+        DataAccess[T]: The cached DAO for that entity class.
+    """
+    return DataAccess(class_name)
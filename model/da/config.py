@@ -8,11 +8,13 @@ Then tables are initialized based on SQLAlchemy models.
 
 Exports:
 - DB_CONFIG      : The configuration dictionary for DB connection.
+- POOL_CONFIG    : Connection pool sizing and warm-up settings.
 - engine         : SQLAlchemy engine for the active database.
 - Session        : SQLAlchemy sessionmaker bound to engine.
 - initialize_database(): Logic for database existence check and initialization.
 """
 
+import logging
 from typing import Dict
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session as SessionType
@@ -20,6 +22,12 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from model.entity.base import Base
 
+# Progress messages go through the stdlib logger: they show up once Logger has
+# configured the root handlers and are discarded otherwise, so importing this
+# module never starts the Logger's queue listener.
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
 # PostgreSQL Database Configuration
 DB_CONFIG: Dict[str, str] = {
     "user": "postgres",
@@ -30,6 +38,14 @@ DB_CONFIG: Dict[str, str] = {
     "target_db": "books_borrow",
 }
 
+# Connection pool settings for the target database engine
+POOL_CONFIG: Dict[str, int] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,  # Seconds before a pooled connection is replaced
+    "warm_connections": 5,  # Connections opened at startup so first queries skip connect/auth
+}
+
 
 def initialize_database() -> Engine:
     """
@@ -42,7 +58,7 @@ def initialize_database() -> Engine:
     try:
         # Connect to default database to check if target DB exists
         temp_engine = create_engine(
-            f"postgresql+psycopg2://{DB_CONFIG['user']}:{DB_CONFIG['password']}"
+            f"postgresql+psycopg://{DB_CONFIG['user']}:{DB_CONFIG['password']}"
             f"@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['default_db']}"
         )
 
@@ -55,25 +71,45 @@ def initialize_database() -> Engine:
 
             if not exists:
                 conn.execute(text(f"CREATE DATABASE {DB_CONFIG['target_db']}"))
-                print(f"✅ Database '{DB_CONFIG['target_db']}' created successfully.")
+                _log.info("Database '%s' created.", DB_CONFIG["target_db"])
+        temp_engine.dispose()
 
         # Connect to the target database
         engine = create_engine(
-            f"postgresql+psycopg2://{DB_CONFIG['user']}:{DB_CONFIG['password']}"
+            f"postgresql+psycopg://{DB_CONFIG['user']}:{DB_CONFIG['password']}"
             f"@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['target_db']}",
             echo=False,
+            insertmanyvalues_page_size=1000,  # Rows per multi-VALUES INSERT
+            connect_args={"prepare_threshold": 0},  # Server-side prepare from the first execution
+            pool_size=POOL_CONFIG["pool_size"],
+            max_overflow=POOL_CONFIG["max_overflow"],
+            pool_recycle=POOL_CONFIG["pool_recycle"],
+            pool_pre_ping=True,  # Replace connections dropped by the server
         )
 
         # Create tables if not already created
         Base.metadata.create_all(engine)
-        print("✅ Tables initialized successfully.")
+
+        # create_all skips existing tables, so add indexes introduced later separately
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+        _log.info("Tables initialized.")
+
+        # Open and return connections so the pool starts with live sockets
+        conns = [engine.connect() for _ in range(POOL_CONFIG["warm_connections"])]
+        for conn in conns:
+            conn.close()
         return engine
 
     except SQLAlchemyError as e:
-        print(f"❌ Database initialization failed: {e}")
+        from model.tools.logger import Logger  # Only configure it when there is an error to show
+
+        Logger.error("%s - Database initialization failed.", e)
         exit(1)
 
 
 # Initialize engine and sessionmaker
 engine: Engine = initialize_database()
-Session: sessionmaker[SessionType] = sessionmaker(bind=engine)
+# expire_on_commit=False keeps loaded attributes readable after the session closes
+Session: sessionmaker[SessionType] = sessionmaker(bind=engine, expire_on_commit=False)
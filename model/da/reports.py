@@ -4,92 +4,174 @@ model/da/reports.py
 Provides report-specific queries and analytics for the application.
 This module retrieves custom data patterns and summaries using SQLAlchemy ORM.
 
+Reports are read-only, so each query is a column select() executed directly;
+rows come back as tuples without ORM instances or identity-map bookkeeping.
+
 Functions:
 - get_current_borrows_with_details
 - get_books_never_borrowed
 - get_members_with_unreturned_books
 - get_report_all_borrows
+- iter_report_all_borrows
 - get_members_never_borrowed
 - get_book_borrow_counts
 """
 
-from typing import List, Tuple
-from sqlalchemy import func, exists
-from sqlalchemy.orm import joinedload
+from datetime import date
+from typing import Iterator, List, Tuple, Union
+from sqlalchemy import Select, exists, func, select
 from sqlalchemy.orm.session import Session
 from model.entity.book import Book
 from model.entity.member import Member
 from model.entity.borrow import Borrow
 
+__all__ = [
+    "get_current_borrows_with_details",
+    "get_books_never_borrowed",
+    "get_members_with_unreturned_books",
+    "get_report_all_borrows",
+    "iter_report_all_borrows",
+    "get_members_never_borrowed",
+    "get_book_borrow_counts",
+]
+
 
-def get_current_borrows_with_details(session: Session) -> List[Borrow]:
+def get_current_borrows_with_details(
+    session: Session,
+) -> List[Tuple[int, str, int, str, str, str]]:
     """
     Retrieve currently borrowed records with related book and member details.
 
+    Only the needed columns are selected, so no ORM objects are built.
+
     Args:
         session: SQLAlchemy session object.
 
     Returns:
-        List of Borrow ORM objects.
+        List of tuples: (book_id, title, member_id, name, family, borrow_date as YYYY-MM-DD or "-").
     """
-    return (
-        session.query(Borrow)
-        .options(joinedload(Borrow.book), joinedload(Borrow.member))
-        .filter(Borrow._return_date.is_(None))
-        .all()
+    stmt = (
+        select(
+            Book._id,
+            Book._title,
+            Member._id,
+            Member._name,
+            Member._family,
+            func.coalesce(func.to_char(Borrow._borrow_date, "YYYY-MM-DD"), "-"),
+        )
+        .select_from(Borrow)
+        .join(Book, Book._id == Borrow._book_id)
+        .join(Member, Member._id == Borrow._member_id)
+        .where(Borrow._return_date.is_(None))
     )
+    return [tuple(row) for row in session.execute(stmt)]
 
 
-def get_books_never_borrowed(session: Session) -> List[Book]:
+def get_books_never_borrowed(session: Session) -> List[Tuple[int, str, str]]:
     """
     Retrieve books that have never been borrowed.
 
+    Uses a correlated NOT EXISTS, which PostgreSQL plans as an anti-join
+    on the borrows.book_id index.
+
     Args:
         session: SQLAlchemy session object.
 
     Returns:
-        List of Book ORM objects.
+        List of tuples: (book_id, title, author).
     """
-    borrowed_book_ids = session.query(Borrow._book_id).distinct()
-    return session.query(Book).filter(Book._id.not_in(borrowed_book_ids)).all()
+    stmt = (
+        select(Book._id, Book._title, Book._author)
+        .where(~exists().where(Borrow._book_id == Book._id))
+    )
+    return [tuple(row) for row in session.execute(stmt)]
 
 
-def get_members_with_unreturned_books(session: Session) -> List[Borrow]:
+def get_members_with_unreturned_books(
+    session: Session,
+) -> List[Tuple[int, str, str, str, int]]:
     """
     Retrieve borrows where books have not been returned yet.
 
+    The delay is computed by the database as current_date - borrow_date.
+
     Args:
         session: SQLAlchemy session object.
 
     Returns:
-        List of Borrow ORM objects.
+        List of tuples: (member_id, name, family, book_title, delay_days).
     """
+    stmt = (
+        select(
+            Member._id,
+            Member._name,
+            Member._family,
+            Book._title,
+            (func.current_date() - Borrow._borrow_date).label("delay"),
+        )
+        .select_from(Borrow)
+        .join(Member, Member._id == Borrow._member_id)
+        .join(Book, Book._id == Borrow._book_id)
+        .where(Borrow._return_date.is_(None))
+    )
+    return [tuple(row) for row in session.execute(stmt)]
+
+
+def _all_borrows_select() -> Select:
+    """Build the column select shared by the all-borrows report functions."""
     return (
-        session.query(Borrow)
-        .options(joinedload(Borrow.member), joinedload(Borrow.book))
-        .filter(Borrow._return_date.is_(None))
-        .all()
+        select(
+            Member._id,
+            Member._name,
+            Member._family,
+            Book._id,
+            Book._title,
+            Book._author,
+            Borrow._borrow_date,
+            Borrow._return_date,
+        )
+        .select_from(Borrow)
+        .join(Member, Member._id == Borrow._member_id)
+        .join(Book, Book._id == Borrow._book_id)
     )
 
 
-def get_report_all_borrows(session: Session) -> List[Borrow]:
+def get_report_all_borrows(
+    session: Session,
+) -> List[Tuple[int, str, str, int, str, str, date, Union[date, None]]]:
     """
-    Retrieve all borrow records with full member and book details.
+    Retrieve all borrow records with member and book details.
 
     Args:
         session: SQLAlchemy session object.
 
     Returns:
-        List of Borrow ORM objects.
+        List of tuples: (member_id, name, family, book_id, title, author, borrow_date, return_date).
     """
-    return (
-        session.query(Borrow)
-        .options(joinedload(Borrow.member), joinedload(Borrow.book))
-        .all()
+    return [tuple(row) for row in session.execute(_all_borrows_select())]
+
+
+def iter_report_all_borrows(
+    session: Session, batch_size: int = 1000
+) -> Iterator[Tuple[int, str, str, int, str, str, date, Union[date, None]]]:
+    """
+    Stream all borrow records through a server-side cursor, batch_size rows at a time.
+
+    Args:
+        session: SQLAlchemy session object; must stay open while iterating.
+        batch_size: Rows fetched per round-trip.
+
+    Yields:
+        Tuples in the same format as get_report_all_borrows().
+    """
+    result = session.execute(
+        _all_borrows_select().execution_options(yield_per=batch_size)
     )
+    for row in result:
+        yield tuple(row)
 
 
-def get_members_never_borrowed(session: Session) -> List[Member]:
+def get_members_never_borrowed(session: Session) -> List[Tuple[int, str, str]]:
     """
     Retrieve members who have never borrowed any books.
 
@@ -97,32 +179,29 @@ def get_members_never_borrowed(session: Session) -> List[Member]:
         session: SQLAlchemy session object.
 
     Returns:
-        List of Member ORM objects.
+        List of tuples: (member_id, name, family).
     """
-    return (
-        session.query(Member)
-        .filter(~exists().where(Member._id == Borrow._member_id))
-        .all()
+    stmt = (
+        select(Member._id, Member._name, Member._family)
+        .where(~exists().where(Member._id == Borrow._member_id))
     )
+    return [tuple(row) for row in session.execute(stmt)]
 
 
 def get_book_borrow_counts(session: Session) -> List[Tuple[int, str, str, int]]:
     """
-    Returns a list of books with the number of times each has been borrowed.
+    Returns every book with the number of times it has been borrowed.
+
+    Books never borrowed are included with a count of 0 (LEFT OUTER JOIN).
 
     :param session: SQLAlchemy session object
     :return: List of tuples: (book_id, title, author, borrow_times)
     """
-    results = (
-        session.query(
-            Book._id,
-            Book._title,
-            Book._author,
-            func.count(Borrow._book_id).label("borrow_times"),
-        )
-        .join(Borrow, Borrow._book_id == Book._id)
+    borrow_times = func.count(Borrow._id).label("borrow_times")
+    stmt = (
+        select(Book._id, Book._title, Book._author, borrow_times)
+        .outerjoin(Borrow, Borrow._book_id == Book._id)
         .group_by(Book._id, Book._title, Book._author)
-        .order_by(func.count(Borrow._book_id).desc())
-        .all()
+        .order_by(borrow_times.desc(), Book._id)
     )
-    return [tuple(row) for row in results]
+    return [tuple(row) for row in session.execute(stmt)]
@@ -4,22 +4,31 @@ model/da/session.py
 Manages SQLAlchemy sessions using a context manager.
 Provides automatic handling of commits and rollbacks.
 
+Sessions come from a thread-local scoped_session, so nested get_session() blocks
+on the same thread share one session (and its identity map) and one transaction.
+
 This module is meant to be reused anywhere safe and transactional access to the database is required.
 """
 
+import threading
 from contextlib import contextmanager
-from sqlalchemy.orm import Session as SessionType  # Typing alias
+from sqlalchemy.orm import Session as SessionType, scoped_session  # Typing alias
 from model.da.config import Session
 from typing import Generator
 
+ScopedSession: scoped_session = scoped_session(Session)
+
+_state = threading.local()  # Per-thread nesting depth of get_session()
+
 
 @contextmanager
 def get_session() -> Generator[SessionType, None, None]:
     """
     Provide a transactional scope for a database session.
 
-    Automatically commits if successful, rolls back on exceptions,
-    and ensures the session is closed in all cases.
+    The outermost block on a thread owns the session: it commits if successful,
+    rolls back on exceptions, and closes the session in all cases. Inner blocks
+    reuse the same session and leave commit/rollback to the outermost one.
 
     Usage:
     -------
@@ -30,12 +39,18 @@ def get_session() -> Generator[SessionType, None, None]:
     Yields:
         SessionType: An active SQLAlchemy session object.
     """
-    session: SessionType = Session()
+    depth: int = getattr(_state, "depth", 0)
+    session: SessionType = ScopedSession()
+    _state.depth = depth + 1
     try:
         yield session
-        session.commit()
+        if depth == 0:
+            session.commit()
     except Exception:
-        session.rollback()
+        if depth == 0:
+            session.rollback()
         raise
     finally:
-        session.close()
+        _state.depth = depth
+        if depth == 0:
+            ScopedSession.remove()
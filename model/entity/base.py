@@ -7,6 +7,7 @@ Provides shared functionality for all SQLAlchemy ORM models.
 Includes __repr__ and to_tuple() for easy debugging and UI usage.
 """
 
+from typing import Any, Tuple
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -16,17 +17,31 @@ class Base(DeclarativeBase):
 
     - Inherits from SQLAlchemy DeclarativeBase to enable ORM mapping.
     - Implements common representation methods for consistency across models.
+    - Caches each mapped subclass's column names in _column_names at class creation,
+      and the ones without foreign keys (shown by __repr__) in _repr_names.
     """
 
+    _column_names: Tuple[str, ...] = ()
+    _repr_names: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Map the subclass, then cache its column names for __repr__ and to_tuple()."""
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "__table__"):
+            cls._column_names = tuple(c.name for c in cls.__table__.columns)
+            cls._repr_names = tuple(
+                c.name for c in cls.__table__.columns if not c.foreign_keys
+            )
+
     def __repr__(self) -> str:
         """
         Return a string representation of the model instance,
-        showing all column values as a dictionary.
+        showing all column values except foreign keys as a dictionary.
         """
-        return str({c.name: getattr(self, c.name) for c in self.__table__.columns})
+        return str({name: getattr(self, name) for name in self._repr_names})
 
     def to_tuple(self) -> tuple:
         """
         Return all column values as a tuple (used for populating tables, etc.).
         """
-        return tuple(getattr(self, c.name) for c in self.__table__.columns)
+        return tuple(getattr(self, name) for name in self._column_names)
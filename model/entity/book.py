@@ -8,7 +8,16 @@ Includes validation and type-safe access via properties.
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import Integer, String
 from model.entity import Base
-from model.tools.validators import title_validator, name_validator, amount_validator
+from model.tools.validators import (
+    make_title_validator,
+    make_name_validator,
+    make_amount_validator,
+)
+
+_validate_id = make_amount_validator("Invalid id!")
+_validate_title = make_title_validator("Invalid book title!")
+_validate_author = make_name_validator("Invalid author name!")
+_validate_pages = make_amount_validator("Invalid pages number!")
 
 
 class Book(Base):
@@ -29,11 +38,13 @@ class Book(Base):
     def __init__(self, title: str, author: str, pages: int):
         """
         Initialize a new Book object with validated fields.
+
+        Validates directly instead of going through the property setters.
         """
         self._id = None
-        self.title = title
-        self.author = author
-        self.pages = pages
+        self._title = _validate_title(title)
+        self._author = _validate_author(author)
+        self._pages = _validate_pages(pages)
 
     @property
     def id(self) -> int:
@@ -43,7 +54,7 @@ class Book(Base):
     @id.setter
     def id(self, value: int) -> None:
         """Set book's ID after validation."""
-        self._id = amount_validator(value, "Invalid id!")
+        self._id = _validate_id(value)
 
     @property
     def title(self) -> str:
@@ -53,7 +64,7 @@ class Book(Base):
     @title.setter
     def title(self, value: str) -> None:
         """Set book's title after validation."""
-        self._title = title_validator(value, "Invalid book title!")
+        self._title = _validate_title(value)
 
     @property
     def author(self) -> str:
@@ -63,7 +74,7 @@ class Book(Base):
     @author.setter
     def author(self, value: str) -> None:
         """Set book's author name after validation."""
-        self._author = name_validator(value, "Invalid author name!")
+        self._author = _validate_author(value)
 
     @property
     def pages(self) -> int:
@@ -73,4 +84,4 @@ class Book(Base):
     @pages.setter
     def pages(self, value: int) -> None:
         """Set number of pages after validation."""
-        self._pages = amount_validator(value, "Invalid pages number!")
+        self._pages = _validate_pages(value)
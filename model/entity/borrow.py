@@ -8,7 +8,7 @@ Includes validation for fields and ORM relationships to Member and Book.
 from typing import Union
 from datetime import date
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, Date, ForeignKey
+from sqlalchemy import Integer, Date, ForeignKey, Index
 from model.entity import Base, Member, Book
 from model.tools.validators import amount_validator, date_validator
 
@@ -22,13 +22,17 @@ class Borrow(Base):
     __tablename__ = "borrows"
 
     _id: Mapped[int] = mapped_column(Integer, autoincrement=True, primary_key=True)
-    _member_id: Mapped[int] = mapped_column(Integer, ForeignKey("members.id"))
-    _book_id: Mapped[int] = mapped_column(Integer, ForeignKey("books.id"))
+    _member_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("members.id"), index=True
+    )
+    _book_id: Mapped[int] = mapped_column(Integer, ForeignKey("books.id"), index=True)
     _borrow_date: Mapped[date] = mapped_column(Date)
     _return_date: Mapped[Union[date, None]] = mapped_column(Date, default=None)
 
-    member = relationship("Member")
-    book = relationship("Book")
+    # Expunging a borrow also detaches its loaded member/book, so eager-loaded
+    # relationships stay usable after the session closes.
+    member = relationship("Member", cascade="save-update, merge, expunge")
+    book = relationship("Book", cascade="save-update, merge, expunge")
 
     def __init__(self, member: Member, book: Book, borrow_date: Union[str, date]):
         """
@@ -47,18 +51,6 @@ class Borrow(Base):
         self.book = book
         self.borrow_date = borrow_date
 
-    def __repr__(self) -> str:
-        """
-        Return a dictionary-like string representation without foreign keys.
-        """
-        return str(
-            {
-                col.name: getattr(self, col.name)
-                for col in self.__table__.columns
-                if not col.foreign_keys
-            }
-        )
-
     @property
     def id(self) -> int:
         """
@@ -128,3 +120,12 @@ class Borrow(Base):
         Set the return date after validating string or date input.
         """
         self._return_date = date_validator(value, "Invalid return date!")
+
+
+# Partial index over outstanding borrows only, so current-borrow reports scale
+# with the number of open borrows rather than the whole borrow history.
+Index(
+    "ix_borrows_active",
+    Borrow._borrow_date,
+    postgresql_where=Borrow._return_date.is_(None),
+)
@@ -8,7 +8,11 @@ Includes field validation and type-safe access via properties.
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import Integer, String
 from model.entity import Base
-from model.tools.validators import name_validator, amount_validator
+from model.tools.validators import make_name_validator, make_amount_validator
+
+_validate_id = make_amount_validator("Invalid id!")
+_validate_name = make_name_validator("Invalid name!")
+_validate_family = make_name_validator("Invalid family!")
 
 
 class Member(Base):
@@ -29,10 +33,12 @@ class Member(Base):
     def __init__(self, name: str, family: str):
         """
         Initialize a new Member object with validated fields.
+
+        Validates directly instead of going through the property setters.
         """
         self._id = None
-        self.name = name
-        self.family = family
+        self._name = _validate_name(name)
+        self._family = _validate_family(family)
 
     @property
     def id(self) -> int:
@@ -42,7 +48,7 @@ class Member(Base):
     @id.setter
     def id(self, value: int) -> None:
         """Set member's ID after validation."""
-        self._id = amount_validator(value, "Invalid id!")
+        self._id = _validate_id(value)
 
     @property
     def name(self) -> str:
@@ -52,7 +58,7 @@ class Member(Base):
     @name.setter
     def name(self, value: str) -> None:
         """Set member's name after validation."""
-        self._name = name_validator(value, "Invalid name!")
+        self._name = _validate_name(value)
 
     @property
     def family(self) -> str:
@@ -62,4 +68,4 @@ class Member(Base):
     @family.setter
     def family(self, value: str) -> None:
         """Set member's family name after validation."""
-        self._family = name_validator(value, "Invalid family!")
+        self._family = _validate_family(value)
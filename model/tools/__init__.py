@@ -7,7 +7,9 @@ such as logging and validation functions for reuse across the app.
 Available imports:
 - Logger: Centralized logger utility
 - validation: Input validation utilities
+- validators_batch: Column-wise validators for bulk inserts
 """
 
 from model.tools.logger import Logger
 from model.tools import validators
+from model.tools import validators_batch
@@ -3,11 +3,21 @@ model/tools/logger.py
 ------------------------
 This module provides a simple logger wrapper around Python's built-in logging.
 It logs messages to both a file and the console using a unified format.
+
+Messages accept %-style arguments, which are only formatted if the record is emitted.
+Handlers are installed on the first log call rather than at import time, and
+records are written by a background QueueListener thread.
 """
 
+import atexit
 import logging
-import sys
 import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Optional
 
 
 class Logger:
@@ -18,41 +28,94 @@ class Logger:
     warning, error, and debug messages.
 
     Logs are written to:
-    - File: log/logging.log
+    - File: log/logging.log (or the path given to configure())
     - Console: Standard output
     """
 
-    log_dir: str = "log"
-    log_file: str = os.path.join(log_dir, "logging.log")
+    log_file: str = os.path.join("log", "logging.log")
+    _configured: bool = False
+    _lock = threading.Lock()
+    _listener: Optional[QueueListener] = None
+
+    @classmethod
+    def configure(cls, log_file: Optional[str] = None) -> None:
+        """
+        Create the log directory and install the handlers.
+
+        Called automatically by the first log call, so importing the module does
+        no file-system work; entry points may call it earlier to pick the file.
+        Callers only enqueue records; a QueueListener thread writes them to the
+        file and console handlers, so logging never blocks on disk I/O.
+        Only the first call has any effect.
+
+        Args:
+            log_file (Optional[str]): Log file path; defaults to log/logging.log.
+        """
+        if cls._configured:
+            return
+        with cls._lock:
+            if cls._configured:
+                return
 
-    # Ensure log directory exists
-    os.makedirs(log_dir, exist_ok=True)
+            if log_file is not None:
+                cls.log_file = log_file
+            Path(cls.log_file).parent.mkdir(parents=True, exist_ok=True)
+
+            formatter = logging.Formatter(
+                "%(asctime)s - %(filename)s - %(levelname)5s - %(message)s"
+            )
+            file_handler = logging.FileHandler(cls.log_file, encoding="utf-8")
+            stream_handler = logging.StreamHandler(sys.stdout)
+            for handler in (file_handler, stream_handler):
+                handler.setFormatter(formatter)
+
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+            cls._listener = QueueListener(log_queue, file_handler, stream_handler)
+            cls._listener.start()
+            atexit.register(cls._listener.stop)  # Drains queued records on exit
+
+            # Only merge args into the message here; the listener's handlers add the layout
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+            logging.basicConfig(
+                level=logging.DEBUG,  # Enables all levels: DEBUG, INFO, WARNING, ERROR
+                handlers=[queue_handler],
+            )
+            cls._configured = True
+
+    @classmethod
+    def is_enabled_for(cls, level: int) -> bool:
+        """
+        Check whether a message at the given level would be emitted.
 
-    logging.basicConfig(
-        level=logging.DEBUG,  # Enables all levels: DEBUG, INFO, WARNING, ERROR
-        format="%(asctime)s - %(filename)s - %(levelname)5s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+        Use it to skip building expensive arguments for filtered messages:
+            if Logger.is_enabled_for(logging.DEBUG):
+                Logger.debug("state=%r", expensive())
+        """
+        cls.configure()
+        return logging.getLogger().isEnabledFor(level)
 
     @classmethod
-    def info(cls, message: str) -> None:
+    def info(cls, message: str, *args: object) -> None:
         """Log an informational message."""
-        logging.info(message)
+        cls.configure()
+        logging.info(message, *args)
 
     @classmethod
-    def warning(cls, message: str) -> None:
+    def warning(cls, message: str, *args: object) -> None:
         """Log a warning message."""
-        logging.warning(message)
+        cls.configure()
+        logging.warning(message, *args)
 
     @classmethod
-    def error(cls, message: str) -> None:
+    def error(cls, message: str, *args: object) -> None:
         """Log an error message."""
-        logging.error(message)
+        cls.configure()
+        logging.error(message, *args)
 
     @classmethod
-    def debug(cls, message: str) -> None:
+    def debug(cls, message: str, *args: object) -> None:
         """Log a debug message (only shown if logging level is DEBUG)."""
-        logging.debug(message)
+        cls.configure()
+        logging.debug(message, *args)
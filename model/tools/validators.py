@@ -10,10 +10,22 @@ Functions:
 - amount_validator: Validates positive integer values.
 - time_validator: Parses and validates time objects.
 - date_validator: Validates and converts string/date to a datetime.date object.
+- make_name_validator / make_title_validator / make_amount_validator:
+  Build single-argument validators with the error message baked in, for entity fields.
+  They hold the rules; the scalar validators above call them (built once per message).
 """
 
-import re
+import string
 from datetime import datetime, date
+from functools import lru_cache
+from typing import Callable
+
+# Deletion tables for str.translate: a value is valid when nothing is left after
+# removing its allowed characters. Whitespace matches re's \s (str.isspace()).
+_WHITESPACE = "".join(c for c in map(chr, range(0x3001)) if c.isspace())
+_NAME_CHARS = str.maketrans("", "", string.ascii_letters + _WHITESPACE + ".")
+_TITLE_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + _WHITESPACE)
+_TYPE_CHARS = str.maketrans("", "", string.ascii_letters + _WHITESPACE)
 
 
 def name_validator(name: str, message: str) -> str:
@@ -25,9 +37,7 @@ def name_validator(name: str, message: str) -> str:
     :return: Validated name.
     :raises ValueError: If validation fails.
     """
-    if isinstance(name, str) and re.match(r"^[a-zA-Z\s\.]{2,30}$", name):
-        return name
-    raise ValueError(message)
+    return make_name_validator(message)(name)
 
 
 def title_validator(title: str, message: str) -> str:
@@ -39,9 +49,7 @@ def title_validator(title: str, message: str) -> str:
     :return: Validated title.
     :raises ValueError: If validation fails.
     """
-    if isinstance(title, str) and re.match(r"^[a-zA-Z0-9\s]{2,30}$", title):
-        return title
-    raise ValueError(message)
+    return make_title_validator(message)(title)
 
 
 def type_validator(type_str: str) -> str:
@@ -52,7 +60,7 @@ def type_validator(type_str: str) -> str:
     :return: Validated type string.
     :raises ValueError: If validation fails.
     """
-    if isinstance(type_str, str) and re.match(r"^[a-zA-Z\s]{3,30}$", type_str):
+    if isinstance(type_str, str) and 3 <= len(type_str) <= 30 and not type_str.translate(_TYPE_CHARS):
         return type_str
     raise ValueError("Invalid type!")
 
@@ -66,9 +74,7 @@ def amount_validator(amount: int, message: str) -> int:
     :return: Validated amount.
     :raises ValueError: If validation fails.
     """
-    if isinstance(amount, int) and amount > 0:
-        return amount
-    raise ValueError(message)
+    return make_amount_validator(message)(amount)
 
 
 def time_validator(time_input) -> datetime.time:
@@ -84,6 +90,19 @@ def time_validator(time_input) -> datetime.time:
     raise ValueError("Invalid time!")
 
 
+@lru_cache(maxsize=1024)
+def _parse_date_str(date_str: str) -> date:
+    """
+    Parse a YYYY-MM-DD string; cached because the same dates recur across calls.
+
+    Zero-padded input goes through the C-level date.fromisoformat; anything else
+    (e.g. "2024-2-9") falls back to strptime, which also accepts unpadded fields.
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        return date.fromisoformat(date_str)
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
 def date_validator(date_input, message: str) -> date:
     """
     Validate and convert a date input (str or datetime.date) to a date object.
@@ -95,10 +114,63 @@ def date_validator(date_input, message: str) -> date:
     """
     try:
         if isinstance(date_input, str):
-            return datetime.strptime(date_input, "%Y-%m-%d").date()
+            return _parse_date_str(date_input)
         elif isinstance(date_input, date):
             return date_input
         else:
             raise ValueError(f"{message} Received: {type(date_input)}")
     except Exception as e:
         raise ValueError(f"Invalid date format! Use YYYY-MM-DD. {e}") from e
+
+
+@lru_cache(maxsize=64)
+def make_name_validator(message: str) -> Callable[[str], str]:
+    """
+    Build a name validator with a fixed error message (name_validator delegates here).
+
+    :param message: Error message on failure.
+    :return: Function validating a single name argument.
+    """
+    chars = _NAME_CHARS
+
+    def validate(name: str) -> str:
+        if isinstance(name, str) and 2 <= len(name) <= 30 and not name.translate(chars):
+            return name
+        raise ValueError(message)
+
+    return validate
+
+
+@lru_cache(maxsize=64)
+def make_title_validator(message: str) -> Callable[[str], str]:
+    """
+    Build a title validator with a fixed error message (title_validator delegates here).
+
+    :param message: Error message on failure.
+    :return: Function validating a single title argument.
+    """
+    chars = _TITLE_CHARS
+
+    def validate(title: str) -> str:
+        if isinstance(title, str) and 2 <= len(title) <= 30 and not title.translate(chars):
+            return title
+        raise ValueError(message)
+
+    return validate
+
+
+@lru_cache(maxsize=64)
+def make_amount_validator(message: str) -> Callable[[int], int]:
+    """
+    Build an amount validator with a fixed error message (amount_validator delegates here).
+
+    :param message: Error message on failure.
+    :return: Function validating a single amount argument.
+    """
+
+    def validate(amount: int) -> int:
+        if isinstance(amount, int) and amount > 0:
+            return amount
+        raise ValueError(message)
+
+    return validate
@@ -0,0 +1,84 @@
+"""
+model/tools/validators_batch.py
+-------------------------------
+Column-wise versions of the validators for bulk inserts.
+
+Each function validates a whole column of values with the same rules (and the same
+ValueError on the first bad value) as its scalar counterpart in validators.py, so
+bulk controllers can validate rows without building an entity per row.
+
+Functions:
+- name_validator_batch: Validates a column of names.
+- title_validator_batch: Validates a column of titles.
+- amount_validator_batch: Validates a column of positive integers.
+- date_validator_batch: Validates and converts a column of dates (None kept as None if allowed).
+"""
+
+from datetime import date
+from typing import Iterable, List, Optional
+
+from model.tools.validators import (
+    date_validator,
+    make_amount_validator,
+    make_name_validator,
+    make_title_validator,
+)
+
+
+def name_validator_batch(names: Iterable[str], message: str) -> List[str]:
+    """
+    Validate every name with name_validator's rules.
+
+    :param names: Input name strings.
+    :param message: Error message on failure.
+    :return: Validated names, in input order.
+    :raises ValueError: On the first invalid name.
+    """
+    validate = make_name_validator(message)
+    return [validate(name) for name in names]
+
+
+def title_validator_batch(titles: Iterable[str], message: str) -> List[str]:
+    """
+    Validate every title with title_validator's rules.
+
+    :param titles: Input title strings.
+    :param message: Error message on failure.
+    :return: Validated titles, in input order.
+    :raises ValueError: On the first invalid title.
+    """
+    validate = make_title_validator(message)
+    return [validate(title) for title in titles]
+
+
+def amount_validator_batch(amounts: Iterable[int], message: str) -> List[int]:
+    """
+    Validate every amount with amount_validator's rules.
+
+    :param amounts: Input amounts.
+    :param message: Error message on failure.
+    :return: Validated amounts, in input order.
+    :raises ValueError: On the first invalid amount.
+    """
+    validate = make_amount_validator(message)
+    return [validate(amount) for amount in amounts]
+
+
+def date_validator_batch(
+    dates: Iterable, message: str, allow_none: bool = False
+) -> List[Optional[date]]:
+    """
+    Validate and convert every date with date_validator's rules.
+
+    Repeated date strings are parsed once, through date_validator's parse cache.
+
+    :param dates: Input dates (str or date).
+    :param message: Error message on failure.
+    :param allow_none: Pass None values through instead of rejecting them.
+    :return: datetime.date objects (or None), in input order.
+    :raises ValueError: On the first invalid date.
+    """
+    return [
+        None if value is None and allow_none else date_validator(value, message)
+        for value in dates
+    ]
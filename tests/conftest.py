@@ -0,0 +1,121 @@
+"""
+Test: shared fixtures
+---------------------
+- db_transaction: every test runs inside one outer transaction that is rolled
+  back afterwards; sessions join it through SAVEPOINTs, so their commits never
+  reach the database.
+- member_da: the shared DataAccess for Member, built once per test session.
+- seeded_borrow: one member, book and open borrow (10 days old) committed once
+  per module for read-only report tests, and deleted afterwards.
+- bulk_members / bulk_books: factories that insert many test rows with one
+  batched INSERT instead of one add/flush/commit per row. Rows are written
+  through DataAccess, so the factories bump the controller list cache themselves.
+- make_member / make_book: single-row versions with defaults, for tests that
+  only need something to borrow against.
+"""
+
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import pytest
+from controller import _cache
+from controller._cache import bump
+from model.da.config import Session, engine
+from model.da.session import ScopedSession
+from model.da import DataAccess, get_dao
+from model.entity import Member, Book, Borrow
+
+
+@pytest.fixture(autouse=True)
+def db_transaction() -> Iterator[None]:
+    """Bind every session to one connection whose transaction is rolled back after the test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    ScopedSession.remove()
+    Session.configure(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield
+    finally:
+        ScopedSession.remove()
+        Session.configure(bind=engine, join_transaction_mode="conditional_savepoint")
+        transaction.rollback()
+        connection.close()
+        _cache.clear()  # Cached rows may belong to the rolled-back transaction
+
+
+@pytest.fixture(scope="session")
+def member_da() -> DataAccess[Member]:
+    """Return the shared Member DAO instead of building one per test."""
+    return get_dao(Member)
+
+
+@pytest.fixture(scope="module")
+def seeded_borrow() -> Iterator[Tuple[Member, Book, Borrow]]:
+    """Commit one open borrow before the module's first test (outside its rollback)."""
+    member = get_dao(Member).save(Member("Seeded", "Reader"))
+    book = get_dao(Book).save(Book("Seeded Book", "Author Seeded", 100))
+    (borrow,) = get_dao(Borrow).save_all_returning(
+        [
+            {
+                "_member_id": member.id,
+                "_book_id": book.id,
+                "_borrow_date": date.today() - timedelta(days=10),
+                "_return_date": None,
+            }
+        ]
+    )
+    yield member, book, borrow
+    get_dao(Borrow).remove_by_id(borrow.id)
+    get_dao(Member).remove_by_id(member.id)
+    get_dao(Book).remove_by_id(book.id)
+
+
+@pytest.fixture
+def bulk_members() -> Callable[[List[Dict[str, str]]], List[Member]]:
+    """Return a factory saving members from {"name", "family"} dicts in one INSERT."""
+
+    def factory(rows: List[Dict[str, str]]) -> List[Member]:
+        members = get_dao(Member).save_all_returning(
+            [{"_name": row["name"], "_family": row["family"]} for row in rows]
+        )
+        bump(Member)
+        return members
+
+    return factory
+
+
+@pytest.fixture
+def bulk_books() -> Callable[[List[Dict[str, object]]], List[Book]]:
+    """Return a factory saving books from {"title", "author", "pages"} dicts in one INSERT."""
+
+    def factory(rows: List[Dict[str, object]]) -> List[Book]:
+        books = get_dao(Book).save_all_returning(
+            [
+                {"_title": row["title"], "_author": row["author"], "_pages": row["pages"]}
+                for row in rows
+            ]
+        )
+        bump(Book)
+        return books
+
+    return factory
+
+
+@pytest.fixture
+def make_member(bulk_members) -> Callable[..., Member]:
+    """Return a factory saving one member without going through the controller."""
+
+    def factory(name: str = "Test", family: str = "Member") -> Member:
+        return bulk_members([{"name": name, "family": family}])[0]
+
+    return factory
+
+
+@pytest.fixture
+def make_book(bulk_books) -> Callable[..., Book]:
+    """Return a factory saving one book without going through the controller."""
+
+    def factory(title: str = "Test Book", author: str = "Test Author", pages: int = 100) -> Book:
+        return bulk_books([{"title": title, "author": author, "pages": pages}])[0]
+
+    return factory
@@ -40,6 +40,13 @@ def test_edit_book():
     assert edited.pages == new_pages
 
 
+def test_edit_missing_book():
+    """Test editing a book that does not exist."""
+    status, result = bc.edit_book(999999999, "Ghost Title", "Ghost Author", 10)
+    assert status is False
+    assert "No book found" in result
+
+
 def test_remove_book_by_id():
     """Test removing a book by ID."""
     status, book = bc.add_book(title="Temp Book", author="Someone", pages=150)
@@ -54,6 +61,39 @@ def test_remove_book_by_id():
     assert status is False
 
 
+def test_add_books_bulk():
+    """Test saving several books at once."""
+    rows = [
+        {"title": "Bulk One", "author": "Bulk Author", "pages": 10},
+        {"title": "Bulk Two", "author": "Bulk Author", "pages": 20},
+    ]
+    status, count = bc.add_books_bulk(rows)
+    assert status is True
+    assert count == 2
+
+    status, books = bc.find_all_books()
+    titles = {b[1] for b in books}
+    assert {"Bulk One", "Bulk Two"} <= titles
+
+
+def test_add_books_bulk_invalid_row():
+    """Test that one invalid row rejects the whole batch."""
+    status, result = bc.add_books_bulk(
+        [{"title": "Valid Bulk", "author": "Author", "pages": 5},
+         {"title": "", "author": "Author", "pages": 5}]
+    )
+    assert status is False
+    assert isinstance(result, str)
+
+
+def test_find_all_books_iter():
+    """Test streaming books matches the list endpoint."""
+    _, book = bc.add_book(title="Streamed Book", author="Stream Author", pages=33)
+    rows = list(bc.find_all_books_iter())
+    assert (book.id, "Streamed Book", "Stream Author", 33) in rows
+    status, listed = bc.find_all_books()
+    assert sorted(rows) == sorted(listed)
+
 # اجرای دستی
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -6,14 +6,12 @@ Integration tests for borrow controller functionality.
 
 import pytest
 from controller import borrow_controller as bc
-from controller import member_controller as mc
-from controller import book_controller as boc
 from datetime import date
 
 
-def test_add_and_find_borrow():
-    _, member = mc.add_member("Test", "Borrower")
-    _, book = boc.add_book("Borrowed Book", "Author X", 200)
+def test_add_and_find_borrow(make_member, make_book):
+    member = make_member("Test", "Borrower")
+    book = make_book("Borrowed Book", "Author X", 200)
     borrow_date = date.today()
     status, borrow = bc.add_borrow(member.id, book.id, borrow_date, None)
     assert status is True
@@ -21,9 +19,9 @@ def test_add_and_find_borrow():
     assert status is True
 
 
-def test_edit_borrow():
-    _, member = mc.add_member("Edit", "Borrower")
-    _, book = boc.add_book("Edit Book", "Edit Author", 222)
+def test_edit_borrow(make_member, make_book):
+    member = make_member("Edit", "Borrower")
+    book = make_book("Edit Book", "Edit Author", 222)
     borrow_date = date.today()
     status, borrow = bc.add_borrow(member.id, book.id, borrow_date, None)
     assert status is True
@@ -35,9 +33,24 @@ def test_edit_borrow():
     assert edited.return_date == return_date
 
 
-def test_remove_borrow_by_id():
-    _, member = mc.add_member("Delete", "Borrower")
-    _, book = boc.add_book("Delete Book", "Author D", 300)
+def test_edit_borrow_unknown_member_or_book(make_member, make_book):
+    member = make_member("Missing", "Borrower")
+    book = make_book("Missing Book", "Author M", 111)
+    status, borrow = bc.add_borrow(member.id, book.id, date.today(), None)
+    assert status is True
+
+    status, message = bc.edit_borrow(borrow.id, 999999, book.id, date.today(), None)
+    assert status is False
+    assert message == "No member found with ID 999999."
+
+    status, message = bc.edit_borrow(borrow.id, member.id, 999999, date.today(), None)
+    assert status is False
+    assert message == "No book found with ID 999999."
+
+
+def test_remove_borrow_by_id(make_member, make_book):
+    member = make_member("Delete", "Borrower")
+    book = make_book("Delete Book", "Author D", 300)
     status, borrow = bc.add_borrow(member.id, book.id, date.today(), None)
     assert status is True
     status, removed = bc.remove_borrow_by_id(borrow.id)
@@ -46,9 +59,9 @@ def test_remove_borrow_by_id():
     assert status is False
 
 
-def test_find_all_borrows():
-    _, member = mc.add_member("All", "Borrows")
-    _, book = boc.add_book("AllBook", "Author All", 111)
+def test_find_all_borrows(make_member, make_book):
+    member = make_member("All", "Borrows")
+    book = make_book("AllBook", "Author All", 111)
     bc.add_borrow(member.id, book.id, date.today(), None)
 
     status, result = bc.find_all_borrows()
@@ -57,5 +70,55 @@ def test_find_all_borrows():
     assert any(row[1] == member.id and row[2] == book.id for row in result)
 
 
+def test_find_borrow_view_bundle(make_member, make_book):
+    member = make_member("Bundle", "Reader")
+    book = make_book("Bundle Book", "Author B", 120)
+    bc.add_borrow(member.id, book.id, date.today(), None)
+
+    status, (borrows, members, books) = bc.find_borrow_view_bundle()
+    assert status is True
+    assert any(row[1] == member.id and row[2] == book.id for row in borrows)
+    assert (member.id, "Bundle", "Reader") in members
+    assert (book.id, "Bundle Book", "Author B", 120) in books
+
+
+def test_add_borrows_bulk(make_member, make_book):
+    member = make_member("Bulk", "Borrower")
+    book = make_book("Bulk Borrow", "Author Bulk", 50)
+    rows = [
+        {"member_id": member.id, "book_id": book.id, "borrow_date": date.today()},
+        {
+            "member_id": member.id,
+            "book_id": book.id,
+            "borrow_date": "2024-01-01",
+            "return_date": "2024-01-10",
+        },
+    ]
+    status, count = bc.add_borrows_bulk(rows)
+    assert status is True
+    assert count == 2
+
+
+def test_find_borrows_by_member_and_book_ids(bulk_members, make_book):
+    member_a, member_b = bulk_members(
+        [{"name": "Group", "family": "Alpha"}, {"name": "Group", "family": "Beta"}]
+    )
+    book = make_book("Grouped Book", "Author G", 90)
+    bc.add_borrow(member_a.id, book.id, date.today(), None)
+    bc.add_borrow(member_a.id, book.id, date.today(), None)
+    bc.add_borrow(member_b.id, book.id, date.today(), None)
+
+    status, by_member = bc.find_borrows_by_member_ids([member_a.id, member_b.id])
+    assert status is True
+    assert len(by_member[member_a.id]) == 2
+    assert len(by_member[member_b.id]) == 1
+
+    status, by_book = bc.find_borrows_by_book_ids([book.id])
+    assert status is True
+    assert len(by_book[book.id]) == 3
+
+    assert bc.find_borrows_by_member_ids([]) == (True, {})
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,151 @@
+"""
+Test: controller/_cache.py
+--------------------------
+Integration tests for the entity lookup cache.
+"""
+
+import pytest
+from datetime import date, timedelta
+from controller import _cache
+from controller import book_controller as bc
+from model.entity.book import Book
+
+
+def test_find_cached_reuses_instance():
+    """Test that repeated lookups return the cached entity."""
+    _, book = bc.add_book(title="Cached Book", author="Cache Author", pages=90)
+
+    first = _cache.find_cached(Book, book.id)
+    second = _cache.find_cached(Book, book.id)
+    assert first is second
+    assert first.title == "Cached Book"
+
+
+def test_invalidate_after_edit():
+    """Test that editing a book drops the stale cached copy."""
+    _, book = bc.add_book(title="Stale Book", author="Cache Author", pages=90)
+    _cache.find_cached(Book, book.id)
+
+    bc.edit_book(book.id, "Fresh Book", "Cache Author", 91)
+    status, found = bc.find_book_by_id(book.id)
+    assert status is True
+    assert found.title == "Fresh Book"
+
+
+def test_missing_id_not_cached():
+    """Test that a lookup miss returns None and is not stored."""
+    assert _cache.find_cached(Book, 999999999) is None
+    assert (Book, 999999999) not in _cache._entries
+
+
+def test_cached_list_reloads_after_bump():
+    """Test that the list cache is reused until the change token moves."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [len(calls)]
+
+    class Marker:
+        pass
+
+    assert _cache.cached_list(Marker, loader) == [1]
+    assert _cache.cached_list(Marker, loader) == [1]
+    _cache.bump(Marker)
+    assert _cache.cached_list(Marker, loader) == [2]
+    assert len(calls) == 2
+
+
+def test_find_all_books_sees_new_book():
+    """Test that adding a book invalidates the cached book list."""
+    bc.find_all_books()
+    _, book = bc.add_book(title="Token Book", author="Token Author", pages=12)
+
+    status, books = bc.find_all_books()
+    assert status is True
+    assert any(row[0] == book.id for row in books)
+
+
+def test_cached_list_reload_bypasses_cache():
+    """Test that reload=True queries even when no local write bumped the token."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [len(calls)]
+
+    class Marker:
+        pass
+
+    assert _cache.cached_report("reloaded_report", None, loader) == [1]
+    assert _cache.cached_list(Marker, loader) == [2]
+    assert _cache.cached_list(Marker, loader) == [2]
+    assert _cache.cached_list(Marker, loader, reload=True) == [3]
+    assert _cache.cached_list(Marker, loader) == [3]
+    assert _cache.cached_report("reloaded_report", None, loader) == [4]
+
+
+def test_cached_report_dropped_by_bump():
+    """Test that report results are reused until a write bumps any token."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [len(calls)]
+
+    assert _cache.cached_report("marker_report", 60, loader) == [1]
+    assert _cache.cached_report("marker_report", 60, loader) == [1]
+    _cache.bump(Book)
+    assert _cache.cached_report("marker_report", 60, loader) == [2]
+
+
+def test_cached_report_expires():
+    """Test that a zero TTL always reloads the report."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [len(calls)]
+
+    _cache.cached_report("expiring_report", 0, loader)
+    _cache.cached_report("expiring_report", 0, loader)
+    assert len(calls) == 2
+
+
+def test_cached_report_without_ttl_reloaded_after_write_during_load():
+    """Test that a report without TTL is kept, unless a write happened while it loaded."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        if len(calls) == 1:
+            _cache.bump(Book)  # A write racing the first query
+        return [len(calls)]
+
+    assert _cache.cached_report("racing_report", None, loader) == [1]
+    assert _cache.cached_report("racing_report", None, loader) == [2]
+    assert _cache.cached_report("racing_report", None, loader) == [2]
+
+
+
+def test_cached_report_reloaded_on_new_day(monkeypatch):
+    """Test that a report without TTL is not reused once the date changes."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [len(calls)]
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    assert _cache.cached_report("daily_report", None, loader) == [1]
+    assert _cache.cached_report("daily_report", None, loader) == [1]
+    monkeypatch.setattr(_cache, "date", Tomorrow)
+    assert _cache.cached_report("daily_report", None, loader) == [2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -46,12 +46,24 @@ def test_remove_member_by_id():
     assert status is False
 
 
-def test_find_all_members():
+def test_find_all_members(bulk_members):
     """Test retrieving all members."""
+    saved = bulk_members([{"name": "Listed", "family": f"Fam{c}"} for c in "abcde"])
+
     status, members = mc.find_all_members()
     assert status is True
     assert isinstance(members, list)
     assert all(isinstance(m, Tuple) for m in members)
+    assert {m.id for m in saved} <= {row[0] for row in members}
+
+
+def test_add_members_bulk():
+    """Test saving several members at once."""
+    status, count = mc.add_members_bulk(
+        [{"name": "Bulk", "family": "Memberone"}, {"name": "Bulk", "family": "Membertwo"}]
+    )
+    assert status is True
+    assert count == 2
 
 
 # اجرای دستی
@@ -0,0 +1,34 @@
+"""
+Test: controller/_ops.py
+------------------------
+Unit tests for the controller_op (status, result) decorator.
+"""
+
+from controller._ops import controller_op, NotFoundError
+
+
+@controller_op("Thing failed.")
+def _succeed(value):
+    return value * 2
+
+
+@controller_op("Thing failed.")
+def _missing(id):
+    raise NotFoundError(f"No thing found with ID {id}.")
+
+
+@controller_op("Thing failed.")
+def _broken():
+    raise ValueError("Invalid thing!")
+
+
+def test_controller_op_wraps_result():
+    assert _succeed(21) == (True, 42)
+
+
+def test_controller_op_not_found_message():
+    assert _missing(7) == (False, "No thing found with ID 7.")
+
+
+def test_controller_op_error_message():
+    assert _broken() == (False, "Invalid thing!")
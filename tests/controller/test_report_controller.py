@@ -8,20 +8,16 @@ import pytest
 from controller import report_controller as rc
 from controller import member_controller as mc
 from controller import book_controller as boc
-from controller import borrow_controller as bc
-from datetime import date
+from controller._cache import invalidate_reports
 
 
-def test_get_currently_borrowed_info():
+def test_get_currently_borrowed_info(seeded_borrow):
     """Test retrieving currently borrowed books."""
-    # آماده‌سازی داده‌ها
-    _, member = mc.add_member("Borrower", "User")
-    _, book = boc.add_book("Borrowed Book", "Author B", 150)
-    bc.add_borrow(member.id, book.id, date.today(), None)
+    member, book, _ = seeded_borrow
 
     data = rc.get_currently_borrowed_info()
     assert isinstance(data, list)
-    assert any(row[1] == "Borrowed Book" for row in data)
+    assert any(row[0] == book.id and row[2] == member.id for row in data)
 
 
 def test_get_books_never_borrowed_info():
@@ -33,15 +29,13 @@ def test_get_books_never_borrowed_info():
     assert any(row[1] == "NeverBorrowed" for row in data)
 
 
-def test_get_members_with_unreturned_info():
-    """Test retrieving members with unreturned books."""
-    _, member = mc.add_member("Late", "Returner")
-    _, book = boc.add_book("Late Book", "Author L", 100)
-    bc.add_borrow(member.id, book.id, date.today(), None)
+def test_get_members_with_unreturned_info(seeded_borrow):
+    """Test retrieving members with unreturned books and their delay in days."""
+    member, book, _ = seeded_borrow
 
     data = rc.get_members_with_unreturned_info()
     assert isinstance(data, list)
-    assert any(row[1] == "Late" for row in data)
+    assert (member.id, "Seeded", "Reader", "Seeded Book", 10) in data
 
 
 def test_get_members_never_borrowed_info():
@@ -53,10 +47,23 @@ def test_get_members_never_borrowed_info():
     assert any(row[1] == "No" for row in data)
 
 
-def test_get_report_all_borrows_info():
+def test_get_report_all_borrows_info(seeded_borrow):
     """Test retrieving full borrow report."""
+    member, book, borrow = seeded_borrow
+
     data = rc.get_report_all_borrows_info()
     assert isinstance(data, list)
+    assert (
+        member.id, "Seeded", "Reader", book.id, "Seeded Book", "Author Seeded",
+        borrow.borrow_date, None,
+    ) in data
+
+
+def test_get_report_all_borrows_iter():
+    """Test that streaming the borrow report yields the same rows as the list."""
+    rows = list(rc.get_report_all_borrows_iter(batch_size=2))
+    invalidate_reports()
+    assert sorted(rows, key=repr) == sorted(rc.get_report_all_borrows_info(), key=repr)
 
 
 def test_get_book_borrow_counts_info():
@@ -68,6 +75,36 @@ def test_get_book_borrow_counts_info():
         assert len(row) == 4
 
 
+def test_get_book_borrow_counts_includes_unborrowed_books(bulk_books):
+    """Test that books without borrows are listed with a zero count."""
+    books = bulk_books(
+        [
+            {"title": "Zero Count", "author": "Author Z", "pages": 80},
+            {"title": "Zero Again", "author": "Author Z", "pages": 81},
+        ]
+    )
+
+    data = rc.get_book_borrow_counts_info()
+    for book in books:
+        assert (book.id, book.title, "Author Z", 0) in data
+
+
+def test_report_failure_raises_and_is_not_cached():
+    """Test that a failing report re-raises its error and is retried on the next call."""
+    calls = []
+
+    @rc.cached_report_result(rc.REPORT_TTL)
+    def broken_report():
+        calls.append(1)
+        raise RuntimeError("query failed")
+
+    with pytest.raises(RuntimeError, match="query failed"):
+        broken_report()
+    with pytest.raises(RuntimeError):
+        broken_report()
+    assert len(calls) == 2
+
+
 # اجرای دستی
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -5,75 +5,165 @@ Unit tests for generic CRUD operations via the DataAccess class.
 """
 
 import pytest
-from model.da.base_access import DataAccess
-from model.entity import Member
+from model.da.base_access import get_dao
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+from model.entity import Member, Book, Borrow
 from datetime import date
 
 
-def test_save_and_find_by_id():
-    da = DataAccess(Member)
+def test_save_and_find_by_id(member_da):
     member = Member(name="TestSave", family="FamilySave")
-    saved_member = da.save(member)
+    saved_member = member_da.save(member)
 
-    found_member = da.find_by_id(saved_member.id)
+    found_member = member_da.find_by_id(saved_member.id)
     assert found_member is not None
     assert found_member.name == "TestSave"
     assert found_member.family == "FamilySave"
 
 
-def test_edit():
-    da = DataAccess(Member)
+def test_save_all_returning(member_da):
+    saved = member_da.save_all_returning(
+        [{"_name": "Bulk", "_family": "FamOne"}, {"_name": "Bulk", "_family": "FamTwo"}]
+    )
+    assert [m.family for m in saved] == ["FamOne", "FamTwo"]
+    assert all(m.id is not None for m in saved)
+    assert member_da.find_by_id(saved[1].id).family == "FamTwo"
+
+
+def test_edit(member_da):
     member = Member(name="TestEdit", family="FamilyEdit")
-    saved_member = da.save(member)
+    saved_member = member_da.save(member)
 
     saved_member.name = "EditedName"
-    da.edit(saved_member)
+    member_da.edit(saved_member)
 
-    updated_member = da.find_by_id(saved_member.id)
+    updated_member = member_da.find_by_id(saved_member.id)
     assert updated_member.name == "EditedName"
 
 
-def test_remove():
-    da = DataAccess(Member)
+def test_update_by_id(member_da):
+    saved_member = member_da.save(Member(name="TestUpdate", family="FamilyUpdate"))
+
+    updated = member_da.update_by_id(saved_member.id, _name="UpdatedName")
+    assert updated.name == "UpdatedName"
+    assert updated.family == "FamilyUpdate"
+    assert member_da.find_by_id(saved_member.id).name == "UpdatedName"
+    assert member_da.update_by_id(999999999, _name="Nobody") is None
+
+
+def test_remove(member_da):
     member = Member(name="TestRemove", family="FamilyRemove")
-    saved_member = da.save(member)
+    saved_member = member_da.save(member)
 
-    da.remove(saved_member)
-    deleted_member = da.find_by_id(saved_member.id)
+    member_da.remove(saved_member)
+    deleted_member = member_da.find_by_id(saved_member.id)
     assert deleted_member is None
 
 
-def test_remove_by_id():
-    da = DataAccess(Member)
+def test_remove_by_id(member_da):
     member = Member(name="TestRemoveID", family="FamilyRemoveID")
-    saved_member = da.save(member)
+    saved_member = member_da.save(member)
 
-    da.remove_by_id(saved_member.id)
-    deleted_member = da.find_by_id(saved_member.id)
+    member_da.remove_by_id(saved_member.id)
+    deleted_member = member_da.find_by_id(saved_member.id)
     assert deleted_member is None
 
 
-def test_find_all():
-    da = DataAccess(Member)
+def test_remove_by_id_returning(member_da):
+    member = Member(name="TestReturning", family="FamilyReturning")
+    saved_member = member_da.save(member)
+
+    removed = member_da.remove_by_id_returning(saved_member.id)
+    assert removed.name == "TestReturning"
+    assert member_da.find_by_id(saved_member.id) is None
+    assert member_da.remove_by_id_returning(saved_member.id) is None
+
+
+def test_find_all(member_da):
     member1 = Member(name="All", family="FamAll")
     member2 = Member(name="all", family="famAll")
-    da.save(member1)
-    da.save(member2)
+    member_da.save(member1)
+    member_da.save(member2)
 
-    members = da.find_all()
+    members = member_da.find_all()
     assert any(m.name == "All" for m in members)
     assert any(m.name == "all" for m in members)
 
 
-def test_find_all_by():
-    da = DataAccess(Member)
+def test_find_all_returns_detached_loaded_entities(member_da):
+    member_da.save(Member(name="Detached", family="FamDetached"))
+
+    members = member_da.find_all()
+    assert all(inspect(m).detached for m in members)
+    assert any(m.family == "FamDetached" for m in members)
+
+
+def test_find_all_tuples(member_da):
+    saved_member = member_da.save(Member(name="Tuple", family="FamTuple"))
+
+    rows = member_da.find_all_tuples(Member._id, Member._name, Member._family)
+    assert all(isinstance(row, tuple) for row in rows)
+    assert (saved_member.id, "Tuple", "FamTuple") in rows
+
+
+def test_iter_tuples_streams_in_batches(member_da):
+    saved_member = member_da.save(Member(name="Stream", family="FamStream"))
+
+    rows = list(member_da.iter_tuples(Member._id, Member._name, batch_size=2))
+    assert (saved_member.id, "Stream") in rows
+    assert len(rows) == len(member_da.find_all_tuples(Member._id))
+
+
+def test_find_all_by(member_da):
     member = Member(name="Special", family="Finder")
-    saved_member = da.save(member)
+    saved_member = member_da.save(member)
 
-    found_members = da.find_all_by(Member._family == "Finder")
+    found_members = member_da.find_all_by(Member._family == "Finder")
     assert any(m.name == "Special" for m in found_members)
 
 
+def test_find_all_by_ids(member_da):
+    first = member_da.save(Member(name="Batch", family="FamBatch"))
+    second = member_da.save(Member(name="Batched", family="FamBatch"))
+
+    found = member_da.find_all_by_ids([first.id, second.id, 999999999])
+    assert sorted(m.id for m in found) == sorted([first.id, second.id])
+    assert member_da.find_all_by_ids([]) == []
+
+
+def test_find_all_raises_on_lazy_load(member_da):
+    member = member_da.save(Member(name="Lazy", family="Loader"))
+    book = get_dao(Book).save(Book(title="Lazy Book", author="Lazy", pages=10))
+    member_id = member.id
+    get_dao(Borrow).save(Borrow(member, book, date.today()))
+
+    borrows = get_dao(Borrow).find_all_by(Borrow._member_id == member_id)
+    with pytest.raises(InvalidRequestError):
+        borrows[0].member
+
+
+def test_find_all_by_with_load_options(member_da):
+    member = member_da.save(Member(name="Eager", family="Loader"))
+    book = get_dao(Book).save(Book(title="Eager Book", author="Eager", pages=10))
+    member_id = member.id
+    get_dao(Borrow).save(Borrow(member, book, date.today()))
+
+    borrows = get_dao(Borrow).find_all_by(
+        Borrow._member_id == member_id,
+        selectinload(Borrow.member),
+        selectinload(Borrow.book),
+    )
+    assert borrows[0].member.name == "Eager"
+    assert borrows[0].book.title == "Eager Book"
+
+
+def test_get_dao_is_shared():
+    assert get_dao(Member) is get_dao(Member)
+    assert get_dao(Member).class_name is Member
+
+
 # ------------------------------
 # Run Tests (if script run directly)
 # ------------------------------
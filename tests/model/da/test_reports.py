@@ -14,19 +14,16 @@ from model.da.reports import (
     get_members_never_borrowed,
     get_book_borrow_counts,
 )
-from model.entity.borrow import Borrow
-from model.entity.book import Book
-from model.entity.member import Member
 
 
-def test_get_current_borrows_with_details():
+def test_get_current_borrows_with_details(seeded_borrow):
     with get_session() as session:
         results = get_current_borrows_with_details(session)
         assert isinstance(results, list)
+        assert results
         for item in results:
-            assert isinstance(item, Borrow)
-            assert item.book is not None
-            assert item.member is not None
+            assert isinstance(item, tuple)
+            assert len(item) == 6  # (book_id, title, member_id, name, family, borrow_date)
 
 
 def test_get_books_never_borrowed():
@@ -34,27 +31,29 @@ def test_get_books_never_borrowed():
         results = get_books_never_borrowed(session)
         assert isinstance(results, list)
         for item in results:
-            assert isinstance(item, Book)
+            assert isinstance(item, tuple)
+            assert len(item) == 3  # (book_id, title, author)
 
 
-def test_get_members_with_unreturned_books():
+def test_get_members_with_unreturned_books(seeded_borrow):
     with get_session() as session:
         results = get_members_with_unreturned_books(session)
         assert isinstance(results, list)
+        assert results
         for item in results:
-            assert isinstance(item, Borrow)
-            assert item.book is not None
-            assert item.member is not None
+            assert isinstance(item, tuple)
+            assert len(item) == 5  # (member_id, name, family, title, delay_days)
+            assert isinstance(item[4], int)
 
 
-def test_get_report_all_borrows():
+def test_get_report_all_borrows(seeded_borrow):
     with get_session() as session:
         results = get_report_all_borrows(session)
         assert isinstance(results, list)
+        assert results
         for item in results:
-            assert isinstance(item, Borrow)
-            assert item.book is not None
-            assert item.member is not None
+            assert isinstance(item, tuple)
+            assert len(item) == 8  # (member_id, name, family, book_id, title, author, borrow_date, return_date)
 
 
 def test_get_members_never_borrowed():
@@ -62,7 +61,8 @@ def test_get_members_never_borrowed():
         results = get_members_never_borrowed(session)
         assert isinstance(results, list)
         for item in results:
-            assert isinstance(item, Member)
+            assert isinstance(item, tuple)
+            assert len(item) == 3  # (member_id, name, family)
 
 
 def test_get_book_borrow_counts():
@@ -0,0 +1,37 @@
+"""
+Test: model/da/session.py
+-------------------------
+Unit tests for the session context manager.
+"""
+
+import pytest
+from model.da.session import get_session
+from model.da.base_access import DataAccess
+from model.entity import Member
+
+
+def test_nested_sessions_share_one_session():
+    with get_session() as outer:
+        with get_session() as inner:
+            assert inner is outer
+
+
+def test_outer_rollback_discards_nested_writes():
+    da = DataAccess(Member)
+    with pytest.raises(RuntimeError):
+        with get_session():
+            saved = da.save(Member(name="Rolled", family="Back"))
+            raise RuntimeError("abort")
+    assert da.find_by_id(saved.id) is None
+
+
+def test_identity_map_reused_in_nested_scope():
+    saved = DataAccess(Member).save(Member(name="Identity", family="Mapped"))
+    with get_session() as session:
+        first = session.get(Member, saved.id)
+        with get_session() as inner:
+            assert inner.get(Member, saved.id) is first
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
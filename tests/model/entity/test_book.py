@@ -41,5 +41,13 @@ def test_book_property_setters():
     assert book.pages == 320
 
 
+def test_book_to_tuple_and_repr():
+    book = Book(title="Clean Code", author="Robert C. Martin", pages=464)
+
+    assert Book._column_names == ("id", "title", "author", "pages")
+    assert book.to_tuple() == (None, "Clean Code", "Robert C. Martin", 464)
+    assert "'title': 'Clean Code'" in repr(book)
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "--tb=short", __file__])
@@ -36,6 +36,18 @@ def test_borrow_with_return_date():
     assert borrow.return_date == return_date
 
 
+def test_borrow_repr_skips_foreign_keys():
+    """Test that repr shows the borrow's own columns but not member/book IDs."""
+    member = Member(name="Repr", family="Reader")
+    book = Book(title="Repr Book", author="Author", pages=10)
+    borrow = Borrow(member, book, date(2024, 1, 2))
+
+    assert Borrow._repr_names == ("_id", "_borrow_date", "_return_date")
+    text = repr(borrow)
+    assert "'_borrow_date': datetime.date(2024, 1, 2)" in text
+    assert "_member_id" not in text and "_book_id" not in text
+
+
 def test_borrow_invalid_member():
     """Test Borrow creation with invalid member object."""
     book = Book(title="Some Book", author="Author", pages=100)
@@ -1,3 +1,4 @@
+import logging
 import pytest
 from model.tools.logger import Logger
 
@@ -26,6 +27,33 @@ def test_debug_log(caplog):
     assert "Test debug message" in caplog.text
 
 
+def test_lazy_format_args(caplog):
+    with caplog.at_level("INFO"):
+        Logger.info("%d items for %s", 3, "lazy")
+    assert "3 items for lazy" in caplog.text
+
+
+def test_lazy_format_skipped_when_filtered(caplog):
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted a filtered record")
+
+    with caplog.at_level("WARNING"):
+        Logger.debug("Never shown %s", Exploding())
+    assert "Never shown" not in caplog.text
+
+
+def test_configured_on_first_call():
+    Logger.info("Configure me")
+    assert Logger._configured is True
+
+
+def test_is_enabled_for(caplog):
+    with caplog.at_level("WARNING"):
+        assert Logger.is_enabled_for(logging.ERROR) is True
+        assert Logger.is_enabled_for(logging.DEBUG) is False
+
+
 # Add this for manual run
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -18,6 +18,25 @@ def test_name_validator_invalid():
         validators.name_validator("12@", "Invalid name")
 
 
+@pytest.mark.parametrize("name", ["J", "A" * 31, "John3", "Jöhn", ""])
+def test_name_validator_rejects_length_and_characters(name):
+    with pytest.raises(ValueError):
+        validators.name_validator(name, "Invalid name")
+
+
+def test_title_validator_allows_digits_and_whitespace():
+    assert validators.title_validator("Book\t42", "Error") == "Book\t42"
+    with pytest.raises(ValueError):
+        validators.title_validator("Book #42", "Invalid title")
+
+
+def test_make_name_validator_bakes_in_message():
+    validate = validators.make_name_validator("Bad name")
+    assert validate("Jane Doe") == "Jane Doe"
+    with pytest.raises(ValueError, match="Bad name"):
+        validate("J4ne")
+
+
 def test_type_validator_valid():
     assert validators.type_validator("Student") == "Student"
 
@@ -51,6 +70,13 @@ def test_date_validator_str():
     assert validators.date_validator("2024-04-10", "Invalid") == date(2024, 4, 10)
 
 
+def test_date_validator_str_cached():
+    validators._parse_date_str.cache_clear()
+    validators.date_validator("2024-02-29", "Error")
+    assert validators.date_validator("2024-02-29", "Error") == date(2024, 2, 29)
+    assert validators._parse_date_str.cache_info().hits == 1
+
+
 def test_date_validator_date():
     d = date(2024, 4, 10)
     assert validators.date_validator(d, "Invalid") == d
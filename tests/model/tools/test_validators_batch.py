@@ -0,0 +1,28 @@
+"""
+Test: model/tools/validators_batch.py
+-------------------------------------
+Unit tests for the column-wise validators used by bulk inserts.
+"""
+
+import pytest
+from datetime import date
+from model.tools import validators_batch
+
+
+def test_name_and_title_batches_keep_order():
+    assert validators_batch.name_validator_batch(["Ann", "Bob Ray"], "Error") == ["Ann", "Bob Ray"]
+    assert validators_batch.title_validator_batch(["Book 1", "Book 2"], "Error") == ["Book 1", "Book 2"]
+
+
+def test_batch_raises_scalar_message_on_first_invalid():
+    with pytest.raises(ValueError, match="Bad amount"):
+        validators_batch.amount_validator_batch([1, 2, 0, -1], "Bad amount")
+
+
+def test_date_batch_converts_and_allows_none():
+    result = validators_batch.date_validator_batch(
+        ["2024-01-05", date(2024, 2, 1), None], "Error", allow_none=True
+    )
+    assert result == [date(2024, 1, 5), date(2024, 2, 1), None]
+    with pytest.raises(ValueError):
+        validators_batch.date_validator_batch([None], "Error")
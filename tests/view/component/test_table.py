@@ -0,0 +1,157 @@
+"""
+Test: view/component/table.py
+-----------------------------
+Unit tests for Table's row bookkeeping. No display is needed: the Tk frame and
+Treeview are replaced by small fakes that record item order and values.
+"""
+
+from itertools import count
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from view.component import table as table_module
+from view.component.table import Table
+
+
+class FakeFrame:
+    """Stands in for the Table container."""
+
+    def __init__(self, parent: Any) -> None:
+        pass
+
+    def place(self, **kwargs: Any) -> None:
+        pass
+
+
+class FakeVar:
+    """Stands in for the filter StringVar."""
+
+    def __init__(self) -> None:
+        self.value = ""
+
+    def get(self) -> str:
+        return self.value
+
+
+class FakeTree:
+    """Treeview subset used by Table: attached items in order, plus their values."""
+
+    def __init__(self) -> None:
+        self.children: List[str] = []
+        self.values: Dict[str, Tuple[Any, ...]] = {}
+        self._next_iid = count(1)  # Never reused after delete(), as in Tk
+
+    def insert(self, parent: str, index: str, values: Tuple[Any, ...]) -> str:
+        iid = f"I{next(self._next_iid)}"
+        self.values[iid] = values
+        self.children.append(iid)
+        return iid
+
+    def item(self, iid: str, values: Tuple[Any, ...]) -> None:
+        self.values[iid] = values
+
+    def move(self, iid: str, parent: str, index: int) -> None:
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def detach(self, *iids: str) -> None:
+        for iid in iids:
+            self.children.remove(iid)
+
+    def delete(self, iid: str) -> None:
+        self.children.remove(iid)
+        del self.values[iid]
+
+    def selection(self) -> Tuple[str, ...]:
+        return ()
+
+    def shown(self) -> List[Tuple[Any, ...]]:
+        return [self.values[iid] for iid in self.children]
+
+
+@pytest.fixture
+def make_table(monkeypatch):
+    """Build a Table over the given rows, backed by FakeTree instead of Tk widgets."""
+
+    def build_ui(self: Table) -> None:
+        self.tree = FakeTree()
+        self.filter_var = FakeVar()
+
+    monkeypatch.setattr(table_module.tk, "Frame", FakeFrame)
+    monkeypatch.setattr(Table, "_build_ui", build_ui)
+
+    def factory(rows: List[Tuple[Any, ...]]) -> Table:
+        return Table(
+            parent=None,
+            headings=["Member ID", "Name", "Book"],
+            column_widths=[70, 150, 150],
+            x=0,
+            y=0,
+            data=rows,
+        )
+
+    return factory
+
+
+# Report-style rows: the first column repeats
+ROWS = [
+    (2, "Sara", "Dune"),
+    (1, "Ali", "Emma"),
+    (2, "Sara", "Atlas"),
+    (1, "Ali", "Beloved"),
+]
+
+
+def test_sort_with_duplicate_first_column(make_table):
+    """Test that header sorts keep every row shown once, in sorted order."""
+    table = make_table(ROWS)
+    assert table.tree.shown() == sorted(ROWS, key=lambda row: row[0])
+
+    table._on_header_click(2)
+    assert table.tree.shown() == sorted(ROWS, key=lambda row: row[2].lower())
+
+    table._on_header_click(1)
+    table._on_header_click(2)
+    expected = sorted(ROWS, key=lambda row: row[2].lower())
+    assert table.tree.shown() == expected
+    assert table._full_data == expected
+    assert len(set(table._row_iids)) == len(table._row_iids)
+
+    table._on_header_click(2)
+    assert table.tree.shown() == expected[::-1]
+
+
+def test_row_methods_with_duplicate_first_column(make_table):
+    """Test that update_row and delete_row touch only the row they changed."""
+    table = make_table(ROWS)
+    table._on_header_click(2)  # Atlas, Beloved, Dune, Emma
+
+    table.update_row((1, "Ali", "Beloved 2"))
+    assert table.tree.shown() == [
+        (2, "Sara", "Atlas"),
+        (1, "Ali", "Beloved 2"),
+        (2, "Sara", "Dune"),
+        (1, "Ali", "Emma"),
+    ]
+
+    table.delete_row(2)
+    assert table.tree.shown() == [
+        (1, "Ali", "Beloved 2"),
+        (2, "Sara", "Dune"),
+        (1, "Ali", "Emma"),
+    ]
+    assert table._full_data == table.tree.shown()
+
+    table.insert_row((3, "Reza", "Candide"))
+    assert table.tree.shown() == [
+        (1, "Ali", "Beloved 2"),
+        (2, "Sara", "Dune"),
+        (1, "Ali", "Emma"),
+        (3, "Reza", "Candide"),
+    ]
+    assert len(set(table._row_iids)) == len(table._row_iids)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
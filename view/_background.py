@@ -0,0 +1,41 @@
+"""
+view/_background.py
+-------------------
+Runs slow controller calls off the Tk thread.
+
+Tkinter is not thread-safe, so worker threads never touch widgets: the call is
+submitted to a shared executor and the Tk thread polls its future with after(),
+handing the finished future to a callback.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+POLL_MS: int = 50  # How often the Tk thread checks whether a background call finished
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="view-bg")
+
+
+def run_in_background(
+    widget: Any, func: Callable[[], Any], on_done: Callable[[Future], None]
+) -> None:
+    """
+    Run func on a worker thread and call on_done(future) on the Tk thread afterwards.
+
+    Safe to call before mainloop() starts; polling begins once it runs.
+
+    Args:
+        widget (Any): Tk widget whose after() schedules the polling.
+        func (Callable[[], Any]): Work to run off the Tk thread; must not touch widgets.
+        on_done (Callable[[Future], None]): Receives the finished future; its
+            result() returns func's value or raises func's exception.
+    """
+    _poll(widget, _executor.submit(func), on_done)
+
+
+def _poll(widget: Any, future: Future, on_done: Callable[[Future], None]) -> None:
+    """Tk thread: hand the future to on_done if finished, else check again later."""
+    if future.done():
+        on_done(future)
+    else:
+        widget.after(POLL_MS, _poll, widget, future, on_done)
@@ -7,6 +7,8 @@ a table for displaying records, and actions such as saving, editing,
 deleting, and refreshing book entries.
 """
 
+from concurrent.futures import Future
+from functools import lru_cache, partial
 from tkinter import Button, ttk, messagebox as msg
 from controller.book_controller import (
     add_book,
@@ -14,8 +16,39 @@ from controller.book_controller import (
     remove_book_by_id,
     find_all_books,
 )
+from view._background import run_in_background
 from view.component import LabelAndEntry, Table
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
+
+
+@lru_cache(maxsize=128)
+def _validate_book(
+    title: str, author: str, pages_str: str
+) -> Tuple[bool, Union[Tuple[str, str, int], str]]:
+    """
+    Validate raw book form input; cached so repeated clicks on unchanged input are free.
+
+    Returns:
+        (True, (title, author, pages)) if valid, else (False, every error, one per line).
+    """
+    title = title.strip()
+    author = author.strip()
+    errors: List[str] = []
+
+    if not title:
+        errors.append("Title is required!")
+    if not author:
+        errors.append("Author is required!")
+    try:
+        pages = int(pages_str)
+        if pages <= 0:
+            errors.append("Pages must be greater than 0!")
+    except ValueError:
+        errors.append("Pages must be an integer!")
+
+    if errors:
+        return False, "\n".join(errors)
+    return True, (title, author, pages)
 
 
 class BookView(ttk.Frame):
@@ -31,10 +64,19 @@ class BookView(ttk.Frame):
     def __init__(self, parent: ttk.Notebook) -> None:
         """Initialize the BookView layout and UI elements."""
         super().__init__(parent)
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        self._write_generation = 0  # Advanced by every local table patch
         self._create_input_fields()
         self._create_book_table()
-        self._reset_form()
         self._create_action_buttons()
+        self.bind("<Map>", self._first_show_once)
+
+    def _first_show_once(self, _: object) -> None:
+        """Load the book list the first time the tab is shown, not at startup."""
+        self.unbind("<Map>")
+        self._reset_form()
+        self.title.entry.focus_set()
 
     def _create_input_fields(self) -> None:
         """Create and position input fields for book data."""
@@ -82,20 +124,17 @@ class BookView(ttk.Frame):
         )
 
     def _create_book_table(self) -> None:
-        """Create the table to display book records."""
-        status, book_list = find_all_books()
+        """Create the (initially empty) table to display book records."""
         self.book_table = Table(
             parent=self,
             headings=["ID", "Title", "Author", "Pages"],
             column_widths=[30, 160, 160, 140],
             x=270,
             y=20,
-            data=book_list,
+            data=[],
             on_double_click=self._load_selected_book,
             table_height=10,
         )
-        if not status:
-            msg.showerror("Load Error", f"Failed to load books: {book_list}")
 
     def _load_selected_book(self, values: Tuple[str, str, str, str]) -> None:
         """Load selected book data into input fields."""
@@ -108,40 +147,74 @@ class BookView(ttk.Frame):
             msg.showerror("Load Error", f"Invalid data selection: {e}")
 
     def _refresh_table_data(self) -> None:
-        """Fetch and display all book records in the table."""
-        status, result = find_all_books()
-        if status:
+        """
+        Fetch and display all book records without blocking the GUI.
+
+        The query runs on a worker thread; a request made while one is running
+        is coalesced into a single follow-up refresh. The controller cache is
+        bypassed, so changes made by other clients show up too.
+        """
+        if self._refresh_in_flight:
+            self._refresh_pending = True
+            return
+        self._refresh_in_flight = True
+        run_in_background(
+            self,
+            partial(find_all_books, reload=True),
+            partial(self._show_fetched, self._write_generation),
+        )
+
+    def _show_fetched(self, generation: int, future: Future) -> None:
+        """
+        Tk thread: apply a fetched result and start any refresh queued meanwhile.
+
+        A result fetched before a local save/edit/delete patched the table is
+        dropped and fetched again, so it cannot undo that change.
+        """
+        try:
+            status, result = future.result()
+        except Exception as e:  # Anything controller_op did not turn into (False, msg)
+            status, result = False, str(e)
+        finally:
+            self._refresh_in_flight = False
+        if status and generation != self._write_generation:
+            self._refresh_pending = True
+        elif status:
             self.book_table.update_data(result)
         else:
             msg.showerror("Refresh Error", f"Could not refresh data: {result}")
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_table_data()
 
     def _reset_form(self) -> None:
         """Clear all input fields and refresh the table."""
+        self._clear_form()
+        self._refresh_table_data()
+
+    def _clear_form(self) -> None:
+        """Clear all input fields, leaving the table as it is."""
         self.id.variable.set(0)
         self.title.variable.set("")
         self.author.variable.set("")
         self.pages.variable.set(0)
-        self._refresh_table_data()
-        self.title.entry.focus_set()
 
     def _create_action_buttons(self) -> None:
         """Create Save, Edit, Delete, and Refresh buttons."""
         btn_y = 220
-        btn_x_distance = 80
-        btn_y_distance = 30
         btn_width = 9
 
-        Button(self, text="Save", command=self.save_click, width=btn_width).place(
-            x=20, y=btn_y
-        )
-        Button(self, text="Edit", command=self.edit_click, width=btn_width).place(
-            x=20 + btn_x_distance, y=btn_y
-        )
-        Button(self, text="Delete", command=self.delete_click, width=btn_width).place(
-            x=20 + 2 * btn_x_distance, y=btn_y
-        )
-        Button(self, text="Refresh", command=self._reset_form, width=32).place(
-            x=20, y=btn_y + btn_y_distance
+        # One placed frame laid out by grid, instead of four separately placed buttons
+        btn_frame = ttk.Frame(self)
+        btn_frame.place(x=20, y=btn_y)
+        for column, (text, command) in enumerate(
+            [("Save", self.save_click), ("Edit", self.edit_click), ("Delete", self.delete_click)]
+        ):
+            Button(btn_frame, text=text, command=command, width=btn_width).grid(
+                row=0, column=column, padx=(0, 4), pady=(0, 4)
+            )
+        Button(btn_frame, text="Refresh", command=self._reset_form).grid(
+            row=1, column=0, columnspan=3, sticky="ew", padx=(0, 4)
         )
 
     def save_click(self) -> None:
@@ -151,8 +224,10 @@ class BookView(ttk.Frame):
             return
         status, result = add_book(*book)
         if status:
+            self._write_generation += 1  # Before the dialog: its event loop may apply a fetch
             msg.showinfo("Save Book", "Book saved successfully.")
-            self._reset_form()
+            self.book_table.insert_row(result.to_tuple())
+            self._clear_form()
         else:
             msg.showerror("Save Error", f"Could not save book: {result}")
 
@@ -169,8 +244,10 @@ class BookView(ttk.Frame):
 
         status, result = edit_book(book_id, *book)
         if status:
+            self._write_generation += 1
             msg.showinfo("Edit Book", "Book updated successfully.")
-            self._reset_form()
+            self.book_table.update_row(result.to_tuple())
+            self._clear_form()
         else:
             msg.showerror("Edit Error", f"Could not update book: {result}")
 
@@ -183,8 +260,10 @@ class BookView(ttk.Frame):
 
         status, result = remove_book_by_id(book_id)
         if status:
+            self._write_generation += 1
             msg.showinfo("Delete Book", "Book deleted successfully.")
-            self._reset_form()
+            self.book_table.delete_row(book_id)
+            self._clear_form()
         else:
             msg.showerror("Delete Error", f"Could not delete book: {result}")
 
@@ -195,22 +274,10 @@ class BookView(ttk.Frame):
         Returns:
             A tuple of (title, author, pages) if valid, else None.
         """
-        title = self.title.variable.get().strip()
-        author = self.author.variable.get().strip()
-        try:
-            pages = int(self.pages.variable.get())
-        except ValueError:
-            msg.showerror("Validation Error", "Pages must be an integer!")
-            return None
-
-        if not title:
-            msg.showerror("Validation Error", "Title is required!")
-            return None
-        if not author:
-            msg.showerror("Validation Error", "Author is required!")
-            return None
-        if pages <= 0:
-            msg.showerror("Validation Error", "Pages must be greater than 0!")
+        status, result = _validate_book(
+            self.title.variable.get(), self.author.variable.get(), self.pages.entry.get()
+        )
+        if not status:
+            msg.showerror("Validation Error", result)
             return None
-
-        return title, author, pages
+        return result
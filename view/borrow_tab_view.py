@@ -7,19 +7,21 @@ date entry fields, and a table to display borrow data. It also handles user acti
 such as save, edit, delete, and refresh operations on borrow records.
 """
 
+import sys
+from concurrent.futures import Future
+from functools import partial
 import tkinter as tk
 from tkinter import Button, ttk, messagebox as msg
 from datetime import date
-from typing import List, Tuple, Union, Optional
+from typing import List, Tuple, Optional
 
 from controller.borrow_controller import (
     add_borrow,
     edit_borrow,
     remove_borrow_by_id,
-    find_all_borrows,
+    find_borrow_view_bundle,
 )
-from controller.book_controller import find_all_books
-from controller.member_controller import find_all_members
+from view._background import run_in_background
 from view.component import LabelAndEntry, LabelAndCombo, LabelAndDate, Table
 
 
@@ -42,24 +44,47 @@ class BorrowView(ttk.Frame):
         self.x_distance = 80
         self.y_distance = 40
 
-        self._load_members_and_books()
+        self._member_label_by_id = {}
+        self._book_label_by_id = {}
+        # Lists the label dicts were last built from; the controllers return the same
+        # cached list object until a member/book write, so an unchanged list is skipped
+        self._indexed_members = None
+        self._indexed_books = None
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        self._write_generation = 0  # Advanced by every local table patch
+
         self._create_member_and_book_input_fields()
         self._create_date_input_fields()
         self._create_borrow_table()
-        self._reset_form_unless_dates()
         self._create_action_buttons()
+        self.bind("<Map>", self._first_show_once)
 
-    def _load_members_and_books(self) -> None:
-        """Load member and book data from controller to populate comboboxes."""
-        members_status, members_data = find_all_members()
-        self.members = members_data if members_status else []
-        if not members_status:
-            msg.showerror("Load Error", f"Failed to load members: {members_data}")
+    def _first_show_once(self, _: object) -> None:
+        """Load members, books and borrows the first time the tab is shown, not at startup."""
+        self.unbind("<Map>")
+        self._reset_whole_form()
+        self.member.combo.focus_set()
 
-        books_status, books_data = find_all_books()
-        self.books = books_data if books_status else []
-        if not books_status:
-            msg.showerror("Load Error", f"Failed to load books: {books_data}")
+    def _load_members_and_books(self, members: List[Tuple], books: List[Tuple]) -> None:
+        """Populate the member and book comboboxes from fetched rows."""
+        self.members = members
+        self.books = books
+
+        # Combo labels built once per list and indexed by ID for selection lookups
+        # (interned, so the combo's label -> ID dict and these share one string object per label)
+        if self.members is not self._indexed_members:
+            self._member_label_by_id = {
+                id: sys.intern(f"{id}-{name} {family}") for id, name, family in self.members
+            }
+            self.member.set_items(list(self._member_label_by_id.items()))
+            self._indexed_members = self.members
+        if self.books is not self._indexed_books:
+            self._book_label_by_id = {
+                id: sys.intern(f"{id}-{title} by {author}") for id, title, author, _ in self.books
+            }
+            self.book.set_items(list(self._book_label_by_id.items()))
+            self._indexed_books = self.books
 
     def _create_member_and_book_input_fields(self) -> None:
         """Create and layout the ID, Member, and Book selection widgets."""
@@ -73,7 +98,7 @@ class BorrowView(ttk.Frame):
             self.entries_x,
             self.entries_y + self.y_distance,
             self.x_distance,
-            [f"{m[0]}-{m[1]} {m[2]}" for m in self.members],
+            [],
         )
         self.book = LabelAndCombo(
             self,
@@ -82,7 +107,7 @@ class BorrowView(ttk.Frame):
             self.entries_x,
             self.entries_y + 2 * self.y_distance,
             self.x_distance,
-            [f"{b[0]}-{b[1]} by {b[2]}" for b in self.books],
+            [],
         )
 
     def _create_date_input_fields(self) -> None:
@@ -97,15 +122,14 @@ class BorrowView(ttk.Frame):
         self.return_date.date_entry.delete(0, tk.END)
 
     def _create_borrow_table(self) -> None:
-        """Create the table to display all borrow records."""
-        status, borrow_list = find_all_borrows()
+        """Create the (initially empty) table to display borrow records."""
         self.borrow_table = Table(
             parent=self,
             headings=["Borrow ID", "Member ID", "Book ID", "Borrow Date", "Return Date"],
             column_widths=[90, 90, 90, 110, 110],
             x=270,
             y=20,
-            data=borrow_list,
+            data=[],
             on_double_click=self._load_selected_borrow,
             table_height=10,
         )
@@ -115,14 +139,14 @@ class BorrowView(ttk.Frame):
         try:
             self.borrow_id.variable.set(int(values[0]))
 
-            member = next((m for m in self.members if m[0] == int(values[1])), None)
-            if member:
-                self.member.combo.set(f"{member[0]}-{member[1]} {member[2]}")
+            member_label = self._member_label_by_id.get(int(values[1]))
+            if member_label:
+                self.member.combo.set(member_label)
                 self.member.combo.hide_list()
 
-            book = next((b for b in self.books if b[0] == int(values[2])), None)
-            if book:
-                self.book.combo.set(f"{book[0]}-{book[1]} by {book[2]}")
+            book_label = self._book_label_by_id.get(int(values[2]))
+            if book_label:
+                self.book.combo.set(book_label)
                 self.book.combo.hide_list()
 
             self.borrow_date.date_entry.set_date(values[3]) if values[3] != "None" else self.borrow_date.date_entry._set_text("")
@@ -131,45 +155,93 @@ class BorrowView(ttk.Frame):
             msg.showerror("Load Error", f"Invalid data selection: {e}")
 
     def _refresh_table_data(self) -> None:
-        """Reload the borrow table with updated data from the controller."""
-        status, result = find_all_borrows()
-        if status:
-            self.borrow_table.update_data(result)
+        """
+        Reload the borrow table from the controller without blocking the GUI.
+
+        The query runs on a worker thread; a request made while one is running
+        is coalesced into a single follow-up refresh. The controller cache is
+        bypassed, so changes made by other clients show up too.
+        """
+        if self._refresh_in_flight:
+            self._refresh_pending = True
+            return
+        self._refresh_in_flight = True
+        run_in_background(
+            self,
+            partial(find_borrow_view_bundle, reload=True),
+            partial(self._show_fetched, self._write_generation),
+        )
+
+    def _show_fetched(self, generation: int, future: Future) -> None:
+        """
+        Tk thread: apply a fetched result and start any refresh queued meanwhile.
+
+        A result fetched before a local save/edit/delete patched the table is
+        dropped and fetched again, so it cannot undo that change.
+        """
+        try:
+            status, result = future.result()
+        except Exception as e:  # Anything controller_op did not turn into (False, msg)
+            status, result = False, str(e)
+        finally:
+            self._refresh_in_flight = False
+        if status and generation != self._write_generation:
+            self._refresh_pending = True
+        elif status:
+            borrows, members, books = result
+            self._load_members_and_books(members, books)
+            self.borrow_table.update_data(borrows)
         else:
             msg.showerror("Refresh Error", f"Could not refresh borrow data: {result}")
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_table_data()
 
     def _reset_form_unless_dates(self) -> None:
         """Reset member/book/ID fields and table, keeping date inputs unchanged."""
+        self._clear_form_unless_dates()
+        self._refresh_table_data()
+
+    def _clear_form_unless_dates(self) -> None:
+        """Clear member/book/ID fields, leaving dates and the table as they are."""
         self.borrow_id.variable.set(0)
         self.member.combo.set("")
         self.member.combo.hide_list()
         self.book.combo.set("")
         self.book.combo.hide_list()
-        self._refresh_table_data()
-        self.member.combo.focus_set()
 
     def _reset_dates(self) -> None:
-        """Destroy and recreate date widgets to reset them."""
-        self.borrow_date.date_entry.destroy()
-        self.return_date.date_entry.destroy()
-        self._create_date_input_fields()
+        """Clear both date fields in place."""
+        self.borrow_date.date_entry.delete(0, tk.END)
+        self.return_date.date_entry.delete(0, tk.END)
 
     def _reset_whole_form(self) -> None:
-        """Reset the entire form: ID, combos, dates, and table."""
+        """Reset the entire form: member/book choices, ID, combos, dates, and table."""
         self._reset_dates()
         self._reset_form_unless_dates()
 
+    def _clear_whole_form(self) -> None:
+        """Clear every input field, leaving the table as it is."""
+        self._reset_dates()
+        self._clear_form_unless_dates()
+
     def _create_action_buttons(self) -> None:
         """Create action buttons and position them below the form."""
         base_y = 220
-        btn_x_distance = 80
-        btn_y_distance = 30
         btn_width = 9
 
-        Button(self, text="Save", command=self.save_click, width=btn_width).place(x=20, y=base_y)
-        Button(self, text="Edit", command=self.edit_click, width=btn_width).place(x=20 + btn_x_distance, y=base_y)
-        Button(self, text="Delete", command=self.delete_click, width=btn_width).place(x=20 + 2 * btn_x_distance, y=base_y)
-        Button(self, text="Refresh", command=self._reset_whole_form, width=32).place(x=20, y=base_y + btn_y_distance)
+        # One placed frame laid out by grid, instead of four separately placed buttons
+        btn_frame = ttk.Frame(self)
+        btn_frame.place(x=20, y=base_y)
+        for column, (text, command) in enumerate(
+            [("Save", self.save_click), ("Edit", self.edit_click), ("Delete", self.delete_click)]
+        ):
+            Button(btn_frame, text=text, command=command, width=btn_width).grid(
+                row=0, column=column, padx=(0, 4), pady=(0, 4)
+            )
+        Button(btn_frame, text="Refresh", command=self._reset_whole_form).grid(
+            row=1, column=0, columnspan=3, sticky="ew", padx=(0, 4)
+        )
 
     def save_click(self) -> None:
         """Handle the save action for a new borrow entry."""
@@ -178,7 +250,9 @@ class BorrowView(ttk.Frame):
             return
         status, result = add_borrow(*borrow)
         if status:
-            self._reset_whole_form()
+            self._write_generation += 1
+            self.borrow_table.insert_row(result.to_tuple())
+            self._clear_whole_form()
             msg.showinfo("Save Borrow", "Borrow saved successfully.")
         else:
             msg.showerror("Save Error", f"Could not save borrow: {result}")
@@ -196,7 +270,9 @@ class BorrowView(ttk.Frame):
 
         status, result = edit_borrow(borrow_id, *borrow)
         if status:
-            self._reset_whole_form()
+            self._write_generation += 1
+            self.borrow_table.update_row(result.to_tuple())
+            self._clear_whole_form()
             msg.showinfo("Edit Borrow", "Borrow updated successfully.")
         else:
             msg.showerror("Edit Error", f"Could not update borrow: {result}")
@@ -210,7 +286,9 @@ class BorrowView(ttk.Frame):
 
         status, result = remove_borrow_by_id(borrow_id)
         if status:
-            self._reset_whole_form()
+            self._write_generation += 1
+            self.borrow_table.delete_row(borrow_id)
+            self._clear_whole_form()
             msg.showinfo("Delete Borrow", "Borrow deleted successfully.")
         else:
             msg.showerror("Delete Error", f"Could not delete borrow: {result}")
@@ -222,17 +300,16 @@ class BorrowView(ttk.Frame):
         Returns:
             A tuple (member_id, book_id, borrow_date, return_date) if valid; otherwise None.
         """
-        member_val = self.member.combo.get()
-        if not member_val:
-            msg.showerror("Validation Error", "Please select a member.")
-            return None
-        member_id = int(member_val.split("-")[0])
-
-        book_val = self.book.combo.get()
-        if not book_val:
-            msg.showerror("Validation Error", "Please select a book.")
+        member_id = self.member.selected_id
+        book_id = self.book.selected_id
+        errors: List[str] = []
+        if member_id is None:
+            errors.append("Please select a member.")
+        if book_id is None:
+            errors.append("Please select a book.")
+        if errors:
+            msg.showerror("Validation Error", "\n".join(errors))
             return None
-        book_id = int(book_val.split("-")[0])
 
         borrow_date = self.borrow_date.date_entry.get_date() if self.borrow_date.date_entry.get() else date.today()
         return_date = self.return_date.date_entry.get_date() if self.return_date.date_entry.get() else None
@@ -4,14 +4,19 @@ view/component/custom_autocomplete_entry.py
 Defines CustomAutocompleteEntry, an enhanced Entry widget with autocomplete support.
 
 Features:
-- Suggestion dropdown (Listbox in a Toplevel popup)
-- Real-time filtering on typing
+- Suggestion dropdown (Listbox in a Toplevel popup), filled a page at a time
+- Real-time filtering on typing (debounced, so a burst of keystrokes filters once)
 - Keyboard and mouse navigation
 - Integration-ready for custom forms
 """
 
 import tkinter as tk
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+FILTER_DELAY_MS: int = 80  # Quiet period after the last keystroke before filtering
+PAGE_SIZE: int = 50  # Suggestions added to the Listbox at a time
+_NAVIGATION_KEYS = frozenset({"Up", "Down", "Return", "Escape", "Tab"})
 
 
 class CustomAutocompleteEntry(tk.Entry):
@@ -23,16 +28,9 @@ class CustomAutocompleteEntry(tk.Entry):
     and disappears on focus out or selection.
     """
 
-    def __init__(self, master: tk.Widget, completevalues: List[str], **kwargs) -> None:
-        """
-        Initialize the autocomplete entry widget.
-
-        Args:
-            master (tk.Widget): Parent container.
-            completevalues (List[str]): List of suggestion strings.
-            **kwargs: Valid arguments for tk.Entry widget.
-        """
-        allowed_keys = {
+    # Entry options passed through from **kwargs; anything else is dropped
+    _ALLOWED_KEYS = frozenset(
+        {
             "bg",
             "fg",
             "font",
@@ -57,62 +55,139 @@ class CustomAutocompleteEntry(tk.Entry):
             "validatecommand",
             "vcmd",
         }
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_keys}
+    )
+
+    def __init__(self, master: tk.Widget, completevalues: List[str], **kwargs) -> None:
+        """
+        Initialize the autocomplete entry widget.
+
+        Args:
+            master (tk.Widget): Parent container.
+            completevalues (List[str]): List of suggestion strings.
+            **kwargs: Valid arguments for tk.Entry widget.
+        """
+        filtered_kwargs = {k: kwargs[k] for k in kwargs.keys() & self._ALLOWED_KEYS}
         super().__init__(master, **filtered_kwargs)
 
-        self.completevalues: List[str] = completevalues
+        self.completevalues = completevalues
         self.var: tk.StringVar = tk.StringVar()
         self.configure(textvariable=self.var)
-        self.var.trace_add("write", self._on_var_change)
 
         self._user_typing: bool = False  # Only show popup if triggered by user
 
         # Key/mouse bindings
         self.bind("<Button-1>", self._on_mouse_click)
-        self.bind("<Key>", self._on_key_press)
+        self.bind("<KeyRelease>", self._on_key_release)
         self.bind("<FocusOut>", self._on_focus_out)
         self.bind("<Down>", self.move_down)
         self.bind("<Up>", self.move_up)
         self.bind("<Return>", self.select_item)
         self.bind("<Escape>", lambda e: self.hide_list())
 
-        # Suggestion popup (Toplevel) and listbox inside it
-        self.popup: tk.Toplevel = tk.Toplevel(self)
+        # Suggestion popup (Toplevel) and listbox inside it, built on first use
+        self.popup: Optional[tk.Toplevel] = None
+        self.listbox: Optional[tk.Listbox] = None
+
+        self.listbox_visible: bool = False
+        self.lb_index: int = 0
+        self._shown: List[str] = []  # Suggestions currently offered by the popup
+        self._loaded: int = 0  # How many of them are inserted in the Listbox
+        self._pending_filter: Optional[str] = None  # after() job of the scheduled filter
+        self._released_text: str = ""  # Entry text at the previous key release
+
+    def _ensure_popup(self) -> None:
+        """Create the suggestion popup and its Listbox the first time they are needed."""
+        if self.popup is not None:
+            return
+        self.popup = tk.Toplevel(self)
         self.popup.wm_overrideredirect(True)
         self.popup.attributes("-topmost", True)
         self.popup.withdraw()
 
-        self.listbox: tk.Listbox = tk.Listbox(
-            self.popup, exportselection=False, borderwidth=0, highlightthickness=0
+        self._listvar = tk.Variable(self)  # Listbox model; set() swaps it in one call
+        self.listbox = tk.Listbox(
+            self.popup,
+            listvariable=self._listvar,
+            exportselection=False,
+            borderwidth=0,
+            highlightthickness=0,
         )
         self.listbox.pack(fill="both", expand=True)
+        self.listbox.configure(yscrollcommand=self._on_listbox_scroll)
         self.listbox.bind("<ButtonRelease-1>", self.on_listbox_click)
         self.listbox.bind("<Motion>", self.on_listbox_motion)
 
-        self.listbox_visible: bool = False
-        self.lb_index: int = 0
+    @property
+    def completevalues(self) -> List[str]:
+        """Suggestion strings offered by the popup."""
+        return self._completevalues
+
+    @completevalues.setter
+    def completevalues(self, values: List[str]) -> None:
+        """Replace the suggestions and their case-folded copies."""
+        self._completevalues: List[str] = values
+        self._folded: List[Tuple[str, str]] = [(s.casefold(), s) for s in values]
+        # Suggestions containing each character, in original order
+        self._by_char: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for pair in self._folded:
+            for char in set(pair[0]):
+                self._by_char[char].append(pair)
+        # Last query and its matches, so a narrower query only rescans those matches
+        self._last_query: str = ""
+        self._last_matches: List[Tuple[str, str]] = self._folded
 
     def _on_mouse_click(self, event: tk.Event) -> None:
         """Trigger popup on mouse click."""
         self._user_typing = True
-        self._on_var_change()
+        self._schedule_filter()
+
+    def _on_key_release(self, event: tk.Event) -> None:
+        """
+        Refresh suggestions after a key that edited the text.
 
-    def _on_key_press(self, event: tk.Event) -> None:
-        """Track keypress to trigger suggestions."""
+        Navigation keys are handled elsewhere; modifier and cursor keys leave the
+        text unchanged, so they neither refilter nor re-open a dismissed popup.
+        """
+        text = self.var.get()
+        edited, self._released_text = text != self._released_text, text
+        if event.keysym in _NAVIGATION_KEYS or not edited:
+            return
         self._user_typing = True
+        self._schedule_filter()
 
-    def _on_var_change(self, *_: object) -> None:
+    def _schedule_filter(self) -> None:
+        """Schedule a suggestion refresh, replacing any refresh still waiting."""
+        if not self._user_typing:
+            return
+        self._cancel_pending_filter()
+        self._pending_filter = self.after(FILTER_DELAY_MS, self._do_filter)
+
+    def _cancel_pending_filter(self) -> None:
+        """Drop the scheduled suggestion refresh, if any."""
+        if self._pending_filter is not None:
+            self.after_cancel(self._pending_filter)
+            self._pending_filter = None
+
+    def _do_filter(self) -> None:
         """Recalculate suggestions and update listbox."""
+        self._pending_filter = None
         if not self._user_typing:
             return
 
-        text = self.var.get()
-        suggestions = (
-            self.completevalues
-            if text == ""
-            else [s for s in self.completevalues if text.lower() in s.lower()]
-        )
-        self.show_list(suggestions)
+        query = self.var.get().casefold()
+        if query == self._last_query and self.listbox_visible:
+            return  # Repeat key/click for unchanged text: the popup already shows it
+        if self._last_query and self._last_query in query:
+            # Anything containing the new query also contains any substring of it
+            pool = self._last_matches
+        elif query:
+            # Every match contains the query's first character
+            pool = self._by_char.get(query[0], [])
+        else:
+            pool = self._folded
+        matches = [pair for pair in pool if query in pair[0]]
+        self._last_query, self._last_matches = query, matches
+        self.show_list([s for _, s in matches])
 
     def _on_focus_out(self, _: tk.Event) -> None:
         """Hide suggestion popup when focus is lost."""
@@ -128,10 +203,16 @@ class CustomAutocompleteEntry(tk.Entry):
         if not suggestions:
             self.hide_list()
             return
-
-        self.listbox.delete(0, tk.END)
-        for s in suggestions:
-            self.listbox.insert(tk.END, s)
+        if suggestions == self._shown and self.popup is not None:
+            if self.listbox_visible:
+                return  # Same rows already showing; nothing to do
+            # Same rows, popup hidden: keep the Listbox model and just re-show it
+        else:
+            self._shown = suggestions
+            self._ensure_popup()
+            first_page = tuple(suggestions[:PAGE_SIZE])
+            self._listvar.set(first_page)
+            self._loaded = len(first_page)
 
         self.update_idletasks()
         x = self.winfo_rootx()
@@ -148,14 +229,30 @@ class CustomAutocompleteEntry(tk.Entry):
         self.listbox.selection_set(self.lb_index)
         self.listbox.activate(self.lb_index)
 
+    def _load_more(self) -> None:
+        """Insert the next page of suggestions with a single Listbox call."""
+        if self._loaded < len(self._shown):
+            page = self._shown[self._loaded:self._loaded + PAGE_SIZE]
+            self.listbox.insert(tk.END, *page)
+            self._loaded += len(page)
+
+    def _on_listbox_scroll(self, _first: str, last: str) -> None:
+        """Load another page once the Listbox is scrolled near its end."""
+        if float(last) > 0.9:
+            self._load_more()
+
     def hide_list(self) -> None:
         """Hide the autocomplete popup."""
-        self.popup.withdraw()
+        self._cancel_pending_filter()
+        if self.popup is not None:
+            self.popup.withdraw()
         self.listbox_visible = False
 
     def move_down(self, _: tk.Event) -> str:
         """Highlight next suggestion with ↓ key."""
         if self.listbox_visible and self.listbox.size() > 0:
+            if self.lb_index + 1 >= self.listbox.size():
+                self._load_more()
             self.lb_index = (self.lb_index + 1) % self.listbox.size()
             self.listbox.selection_clear(0, tk.END)
             self.listbox.selection_set(self.lb_index)
@@ -215,8 +312,10 @@ class CustomAutocompleteEntry(tk.Entry):
         Args:
             value (str): The text to insert into the Entry.
         """
-        self.var.set(value)
+        # Not user typing: drop any refresh still queued from earlier keys
         self._user_typing = False
+        self._cancel_pending_filter()
+        self.var.set(value)
 
     def set_completion_list(self, values: List[str]) -> None:
         """
@@ -12,7 +12,7 @@ Classes:
 import tkinter as tk
 from tkinter import ttk, StringVar, IntVar
 from tkcalendar import DateEntry
-from typing import Union, List, Optional
+from typing import Dict, Union, List, Optional, Tuple
 
 from view.component.custom_autocomplete_entry import CustomAutocompleteEntry
 
@@ -24,6 +24,8 @@ class LabelAndEntry:
     Supports variable binding for str/int types and optional readonly mode.
     """
 
+    __slots__ = ("variable", "entry")
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -64,6 +66,8 @@ class LabelAndCombo:
     A composite widget combining a Label and a custom autocomplete Entry field.
     """
 
+    __slots__ = ("combo", "_id_by_label")
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -72,7 +76,7 @@ class LabelAndCombo:
         x: int,
         y: int,
         distance: int,
-        values: List[str],
+        items: List[Tuple[int, str]],
     ) -> None:
         """
         Initialize the LabelAndCombo widget.
@@ -84,14 +88,28 @@ class LabelAndCombo:
             x: X-coordinate of label.
             y: Y-coordinate of label.
             distance: Distance between label and entry.
-            values: Autocomplete suggestion list.
+            items: (id, label) pairs; labels become the autocomplete suggestions.
         """
         ttk.Label(parent, text=label_text).place(x=x, y=y)
 
-        self.combo = CustomAutocompleteEntry(
-            master=parent, completevalues=values, width=width
-        )
+        self.combo = CustomAutocompleteEntry(master=parent, completevalues=[], width=width)
         self.combo.place(x=x + distance, y=y)
+        self.set_items(items)
+
+    def set_items(self, items: List[Tuple[int, str]]) -> None:
+        """
+        Replace the selectable entries.
+
+        Args:
+            items: (id, label) pairs; labels become the autocomplete suggestions.
+        """
+        self._id_by_label: Dict[str, int] = {label: id for id, label in items}
+        self.combo.completevalues = list(self._id_by_label)
+
+    @property
+    def selected_id(self) -> Optional[int]:
+        """ID behind the current combo text, or None if it matches no label."""
+        return self._id_by_label.get(self.combo.get())
 
 
 class LabelAndDate(ttk.Frame):
@@ -5,14 +5,22 @@ Reusable GUI Table component built with Tkinter + ttk.Treeview.
 
 Features:
 - Supports column-based sorting (clickable headers)
-- Filter bar with real-time search
+- Filter bar with real-time search (debounced, so a burst of keystrokes filters once)
 - Scrollable and resizable container
 - Double-click row event handler (optional)
+- Paged rendering: rows are added to the Treeview a page at a time as the user scrolls
+- Single-row insert/update/delete keyed by the row's first column (its ID)
 """
 
 import tkinter as tk
+from bisect import bisect_right
+from functools import partial
+from itertools import accumulate
+from operator import itemgetter
 from tkinter import ttk, Entry, StringVar
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+FILTER_DELAY_MS: int = 50  # Quiet period after the last filter keystroke before refiltering
 
 
 class Table:
@@ -53,11 +61,32 @@ class Table:
         self.headings = headings
         self.column_widths = column_widths
         self.table_height = table_height
-        self._original_data = data
-        self._filter_active = False
-        self._last_sorted_col = self.headings[0]
+        self._original_data = list(data)  # Own copy, since the row methods mutate it
+        self._search_index = [self._search_text(row) for row in self._original_data]
+        # Last filter query and the indices it matched; None whenever the data changes
+        self._prev_query = ""
+        self._prev_indices: Optional[List[int]] = None
+        # _search_index joined into one string, and where each row starts in it;
+        # built on the first full scan after the data changes
+        self._blob: Optional[str] = None
+        self._row_starts: List[int] = []
+        # Query the shown rows were filtered with ("" when nothing is typed), and the
+        # ascending sort per column index for it; cleared whenever the data or the
+        # query changes
+        self._applied_query = ""
+        self._sort_cache: Dict[int, List[Tuple[Any, ...]]] = {}
+        self._last_sorted_col_idx = 0  # Index into headings of the sorted column
         self._last_reverse = False
         self.on_double_click = on_double_click
+        self._pending_filter: Optional[str] = None  # after() job of the scheduled refilter
+        self._page_size = 200
+        self._full_data: List[Tuple[Any, ...]] = []
+        self._rendered = 0
+        # Every Treeview item created so far: the first _rendered are attached and show
+        # _full_data[:_rendered] position by position; the rest are detached and reused
+        # before inserting new ones. Items are found by position, never by row ID, since
+        # report tables repeat values in their first column.
+        self._row_iids: List[str] = []
 
         self._build_ui()
         self._refresh_tree(self._get_filtered_data())
@@ -67,12 +96,21 @@ class Table:
         self._placeholder_text = "Fast Filter"
         self.filter_var = StringVar()
 
-        self.filter_entry = Entry(
-            self.container, textvariable=self.filter_var, foreground="gray"
-        )
-        self.filter_entry.insert(0, self._placeholder_text)
+        self.filter_entry = Entry(self.container, textvariable=self.filter_var)
         self.filter_entry.pack(fill="x")
 
+        # The placeholder is a label over the empty entry, so filter_var only ever
+        # holds what the user typed
+        self._placeholder = tk.Label(
+            self.container,
+            text=self._placeholder_text,
+            foreground="gray",
+            background=self.filter_entry.cget("background"),
+        )
+        self._placeholder.bind("<Button-1>", lambda _: self.filter_entry.focus_set())
+        self._filter_has_focus = False
+        self._show_placeholder()
+
         self.filter_entry.bind("<FocusIn>", self._on_focus_in)
         self.filter_entry.bind("<FocusOut>", self._on_focus_out)
         self.filter_var.trace_add("write", self._on_filter_change)
@@ -87,8 +125,10 @@ class Table:
             height=self.table_height,
         )
 
-        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        self._vsb = vsb = ttk.Scrollbar(
+            table_frame, orient="vertical", command=self.tree.yview
+        )
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -102,7 +142,7 @@ class Table:
             self.tree.heading(
                 idx,
                 text=label,
-                command=lambda c=self.headings[idx]: self._on_header_click(c),
+                command=partial(self._on_header_click, idx),
             )
 
         if self.on_double_click:
@@ -123,75 +163,268 @@ class Table:
         except IndexError:
             return None
 
+    def _show_placeholder(self) -> None:
+        """Overlay the placeholder text on the (empty) filter entry."""
+        self._placeholder.place(in_=self.filter_entry, x=1, rely=0.5, anchor="w")
+
     def _on_focus_in(self, _: tk.Event) -> None:
-        """Remove placeholder text on entry focus."""
-        if (
-            not self._filter_active
-            and self.filter_entry.get() == self._placeholder_text
-        ):
-            self.filter_entry.delete(0, "end")
-            self.filter_entry.config(foreground="black")
-            self._filter_active = True
+        """Hide the placeholder on entry focus."""
+        self._filter_has_focus = True
+        self._placeholder.place_forget()
 
     def _on_focus_out(self, _: tk.Event) -> None:
-        """Restore placeholder text if entry is empty."""
-        if not self.filter_entry.get().strip():
-            self._filter_active = False
-            self.filter_entry.insert(0, self._placeholder_text)
-            self.filter_entry.config(foreground="gray")
+        """Show the placeholder again if the entry is left empty."""
+        self._filter_has_focus = False
+        if not self.filter_var.get().strip():
+            self.filter_var.set("")
+            self._show_placeholder()
 
     def _on_filter_change(self, *_: Any) -> None:
-        """Refresh table when filter text changes."""
-        if self._filter_active:
-            self._refresh_tree(self._get_filtered_data())
+        """
+        Schedule a table refresh when filter text changes, replacing any still waiting.
+
+        Writes that leave the shown query unchanged (e.g. a trailing space) are ignored.
+        """
+        self._cancel_pending_filter()
+        if self._current_query() == self._applied_query:
+            return
+        self._pending_filter = self.container.after(FILTER_DELAY_MS, self._do_filter)
 
-    def _on_header_click(self, col: str) -> None:
-        """Sort by clicked column, toggling ascending/descending."""
-        if self._last_sorted_col == col:
+    def _cancel_pending_filter(self) -> None:
+        """Drop the scheduled refilter, if any."""
+        if self._pending_filter is not None:
+            self.container.after_cancel(self._pending_filter)
+            self._pending_filter = None
+
+    def _do_filter(self) -> None:
+        """Refresh table with the current filter text."""
+        self._pending_filter = None
+        self._refresh_tree(self._get_filtered_data())
+
+    def _current_query(self) -> str:
+        """Normalised filter text ("" when nothing is typed)."""
+        return self.filter_var.get().lower().strip()
+
+    def _on_header_click(self, col_idx: int) -> None:
+        """Sort by clicked column (its index in headings), toggling ascending/descending."""
+        if self._last_sorted_col_idx == col_idx:
             self._last_reverse = not self._last_reverse
+            if self._shows_whole_sort():
+                self._reverse_shown()
+                return
         else:
-            self._last_sorted_col = col
+            self._last_sorted_col_idx = col_idx
             self._last_reverse = False
-        self._refresh_tree(self._get_filtered_data())
+        data = self._get_filtered_data()
+        if not self._resort_only(data):
+            self._refresh_tree(data)
+
+    def _shows_whole_sort(self) -> bool:
+        """
+        Whether every row of the current sort is on screen, in its cached order.
+
+        The sort cache entry exists only while neither the data nor the query has
+        changed since the shown rows were sorted.
+        """
+        return (
+            self._last_sorted_col_idx in self._sort_cache
+            and self._current_query() == self._applied_query
+            and self._rendered == len(self._full_data)
+        )
+
+    def _reverse_shown(self) -> None:
+        """Reverse the order of the shown items, without sorting or touching values."""
+        tree = self.tree
+        order = self._row_iids[: self._rendered][::-1]
+        for pos, iid in enumerate(order):
+            tree.move(iid, "", pos)
+        self._row_iids[: self._rendered] = order
+        self._full_data.reverse()
+
+    def _resort_only(self, data: List[Tuple[Any, ...]]) -> bool:
+        """
+        Reorder the shown items to match data, if it holds exactly the rows on screen.
+
+        Items are moved rather than rewritten, so no values cross into Tk at all.
+        Rows are matched to items by object identity: data is sorted from the same
+        row tuples that _full_data holds, and equal rows stay distinct.
+
+        Returns:
+            bool: False (and nothing moved) if data is not a reordering of the shown rows.
+        """
+        if not len(data) == self._rendered == len(self._full_data):
+            return False
+        iid_by_row = {id(row): iid for row, iid in zip(self._full_data, self._row_iids)}
+        if len(iid_by_row) != len(data):
+            return False  # The same tuple object shown twice
+        order = [iid_by_row.get(id(row)) for row in data]
+        if None in order or len(set(order)) != len(order):
+            return False
+        tree = self.tree
+        for pos, iid in enumerate(order):
+            tree.move(iid, "", pos)
+        self._row_iids[: len(order)] = order
+        self._full_data = data
+        return True
 
     def _get_filtered_data(self) -> List[Tuple[Any, ...]]:
         """
         Apply search filter and sort current data.
 
+        With the data and query unchanged since a column was last sorted, the cached
+        ascending order is reused, so toggling the direction does no key work at all.
+
         Returns:
             List[Tuple]: Filtered and sorted dataset.
         """
-        query = self.filter_var.get().lower().strip()
-        filtered = [
-            row
-            for row in self._original_data
-            if not self._filter_active
-            or any(query in str(cell).lower() for cell in row)
-        ]
+        query = self._current_query()
+        if query != self._applied_query:
+            self._sort_cache.clear()
+            self._applied_query = query
 
-        col_idx = self.headings.index(self._last_sorted_col)
-        try:
-            return sorted(
-                filtered,
-                key=lambda row: (
-                    int(row[col_idx])
-                    if str(row[col_idx]).isdigit()
-                    else str(row[col_idx]).lower()
-                ),
-                reverse=self._last_reverse,
-            )
-        except Exception:
-            return sorted(
-                filtered,
-                key=lambda row: str(row[col_idx]).lower(),
-                reverse=self._last_reverse,
+        col_idx = self._last_sorted_col_idx
+        ascending = self._sort_cache.get(col_idx)
+        if ascending is None:
+            rows = self._filter_rows(query)
+            ascending = sorted(rows, key=self._column_sort_key(rows, col_idx))
+            self._sort_cache[col_idx] = ascending
+        return ascending[::-1] if self._last_reverse else list(ascending)
+
+    def _filter_rows(self, query: str) -> List[Tuple[Any, ...]]:
+        """Return the rows matching the filter query (all rows for an empty query)."""
+        if not query:
+            return self._original_data
+        # A query containing the previous one can only match a subset of its rows
+        if self._prev_indices is not None and self._prev_query in query:
+            index = self._search_index
+            indices = [i for i in self._prev_indices if query in index[i]]
+        else:
+            indices = self._scan_all(query)
+        self._prev_query, self._prev_indices = query, indices
+        data = self._original_data
+        return [data[i] for i in indices]
+
+    def _scan_all(self, query: str) -> List[int]:
+        """
+        Return the indices of all rows whose search text contains query.
+
+        Searches one joined string with str.find, restarting at the next row after
+        each hit, so the loop runs once per matching row rather than once per row.
+        Broad queries that match most rows finish with a per-row test instead.
+        """
+        if not query:
+            return list(range(len(self._search_index)))
+        if self._blob is None:
+            # NUL separates rows as it does cells, so a match never spans two rows
+            self._blob = "\0".join(self._search_index)
+            self._row_starts = list(
+                accumulate((len(text) + 1 for text in self._search_index), initial=0)
             )
+        find = self._blob.find
+        starts = self._row_starts
+        last_row = len(self._search_index) - 1
+        indices: List[int] = []
+        pos = find(query)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            indices.append(row)
+            if row == last_row:
+                break
+            if len(indices) > 64 and len(indices) * 8 > row:
+                # Most rows match: a per-row test is cheaper than a find() per hit
+                index = self._search_index
+                indices.extend(
+                    i for i in range(row + 1, last_row + 1) if query in index[i]
+                )
+                break
+            pos = find(query, starts[row + 1])
+        return indices
+
+    def _column_sort_key(
+        self, rows: List[Tuple[Any, ...]], col_idx: int
+    ) -> Callable[[Tuple[Any, ...]], Any]:
+        """
+        Pick the cheapest row key that sorts the column like _sort_key.
+
+        All-int columns (IDs, counts) sort on the value itself and all-str columns
+        without digit-only cells on the lowercased text; anything else (dates, None,
+        mixed cells) goes through _sort_key.
+        """
+        values = [row[col_idx] for row in rows]
+        if all(type(value) is int for value in values):
+            return itemgetter(col_idx)
+        if all(type(value) is str and not value.isdecimal() for value in values):
+            return lambda row: row[col_idx].lower()
+        sort_key = self._sort_key
+        return lambda row: sort_key(row[col_idx])
+
+    @staticmethod
+    def _sort_key(value: Any) -> Tuple[int, Any]:
+        """
+        Sort key for a cell: numbers by value, everything else case-insensitively.
+
+        The leading 0/1 tag keeps ints and strings from ever being compared with
+        each other, so mixed columns sort numbers first instead of raising.
+        """
+        text = str(value)
+        return (0, int(text)) if text.isdecimal() else (1, text.lower())
 
     def _refresh_tree(self, data: List[Tuple[Any, ...]]) -> None:
-        """Clear and reload Treeview with given data."""
-        self.tree.delete(*self.tree.get_children())
-        for item in data:
-            self.tree.insert("", "end", values=item)
+        """
+        Show the first page of the given data in the Treeview.
+
+        Items already shown are rewritten in place, and only where their values
+        changed. A longer page reattaches previously detached items before inserting
+        new ones; a shorter one detaches the surplus instead of deleting it. Items
+        are never destroyed here, so a refresh costs one Tk call per changed row.
+        """
+        tree = self.tree
+        iids = self._row_iids
+        new_page = data[: self._page_size]
+        old_page = self._full_data[: self._rendered]
+        moved = False  # Whether any item now shows a different row than before
+        for iid, new, old in zip(iids, new_page, old_page):
+            if new != old:
+                tree.item(iid, values=new)
+                moved = moved or new[0] != old[0]
+        kept = min(len(new_page), len(old_page))
+        if kept < len(old_page):
+            tree.detach(*iids[kept : len(old_page)])
+            moved = True
+        if moved:
+            selection = tree.selection()
+            if selection:
+                tree.selection_remove(selection)
+
+        self._full_data = data
+        self._rendered = kept
+        self._render_until(len(new_page))
+
+    def _render_next_page(self) -> None:
+        """Append the next page of rows (if any) to the Treeview."""
+        self._render_until(self._rendered + self._page_size)
+
+    def _render_until(self, end: int) -> None:
+        """Show rows up to (not including) position end, reusing detached items first."""
+        end = min(end, len(self._full_data))
+        tree = self.tree
+        iids = self._row_iids
+        for pos in range(self._rendered, end):
+            row = self._full_data[pos]
+            if pos < len(iids):
+                iid = iids[pos]
+                tree.move(iid, "", pos)
+                tree.item(iid, values=row)
+            else:
+                iid = tree.insert("", "end", values=row)
+                iids.append(iid)
+        self._rendered = end
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """Update the scrollbar and load another page once the view nears the end."""
+        self._vsb.set(first, last)
+        if float(last) > 0.9 and self._rendered < len(self._full_data):
+            self._render_next_page()
 
     def update_data(self, data: List[Tuple[Any, ...]]) -> None:
         """
@@ -200,9 +433,97 @@ class Table:
         Args:
             data (List[Tuple]): New dataset to apply.
         """
-        self._original_data = data
-        self._filter_active = False
-        self.filter_entry.delete(0, "end")
-        self.filter_entry.insert(0, self._placeholder_text)
-        self.filter_entry.config(foreground="gray")
+        self._original_data = list(data)
+        self._search_index = [self._search_text(row) for row in self._original_data]
+        self._prev_indices = None
+        self._blob = None
+        self._sort_cache.clear()
+        self.filter_var.set("")
+        self._cancel_pending_filter()
+        if not self._filter_has_focus:
+            self._show_placeholder()
         self._refresh_tree(self._get_filtered_data())
+
+    def insert_row(self, row: Tuple[Any, ...]) -> None:
+        """
+        Add a single row without reloading the table.
+
+        The row is appended after the current rows; it takes its sorted place on
+        the next full refresh.
+
+        Args:
+            row (Tuple): New row, with its ID in the first column.
+        """
+        self._original_data.append(row)
+        self._search_index.append(self._search_text(row))
+        self._prev_indices = None
+        self._blob = None
+        self._sort_cache.clear()
+        if self._current_query():
+            self._refresh_tree(self._get_filtered_data())
+            return
+        self._full_data.append(row)
+        if self._rendered == len(self._full_data) - 1:
+            self._render_until(self._rendered + 1)
+
+    def update_row(self, row: Tuple[Any, ...]) -> None:
+        """
+        Replace the row with the same ID in place.
+
+        Args:
+            row (Tuple): Updated row, with its ID in the first column.
+        """
+        pos = self._replace_row(row[0], row)
+        if self._current_query():
+            self._refresh_tree(self._get_filtered_data())
+            return
+        if pos is not None and pos < self._rendered:
+            self.tree.item(self._row_iids[pos], values=row)
+
+    def delete_row(self, id: Any) -> None:
+        """
+        Remove the row with the given ID.
+
+        Args:
+            id (Any): Value of the row's first column.
+        """
+        rendered = self._rendered
+        pos = self._replace_row(id, None)
+        if pos is not None and pos < rendered:
+            self.tree.delete(self._row_iids.pop(pos))
+
+    def _replace_row(self, id: Any, row: Optional[Tuple[Any, ...]]) -> Optional[int]:
+        """
+        Replace (or, when row is None, drop) the first row with this ID in the data lists.
+
+        Returns:
+            Optional[int]: Position of the row in _full_data, or None if it is not there.
+        """
+        self._prev_indices = None
+        self._blob = None
+        self._sort_cache.clear()
+        for idx, current in enumerate(self._original_data):
+            if current[0] == id:
+                if row is not None:
+                    self._original_data[idx] = row
+                    self._search_index[idx] = self._search_text(row)
+                else:
+                    del self._original_data[idx]
+                    del self._search_index[idx]
+                break
+        for idx, current in enumerate(self._full_data):
+            if current[0] == id:
+                if row is not None:
+                    self._full_data[idx] = row
+                else:
+                    del self._full_data[idx]
+                    if idx < self._rendered:
+                        self._rendered -= 1
+                return idx
+        return None
+
+    @staticmethod
+    def _search_text(row: Tuple[Any, ...]) -> str:
+        """Lowercased cells of a row, joined so a filter query needs one substring test."""
+        # NUL cannot be typed into the filter, so a query never spans two cells
+        return "\0".join(str(cell).lower() for cell in row)
@@ -9,9 +9,13 @@ Tabs:
 - Books
 - Borrows
 - Reports
+
+Only the Members view is built at startup; the other views are built the first
+time their tab is selected.
 """
 
 from tkinter import Tk, ttk
+from typing import Dict, Optional, Tuple
 from view import BorrowView, MemberView, BookView, ReportView
 
 
@@ -25,6 +29,15 @@ class MainApplication:
     - Manages focus behavior when switching tabs
     """
 
+    # Tab text -> view class, in tab order
+    _PAGES = {
+        "Members": MemberView,
+        "Books": BookView,
+        "Borrows": BorrowView,
+        "Reports": ReportView,
+    }
+    _screen_size: Optional[Tuple[int, int]] = None  # Queried from Tk once per process
+
     def __init__(self) -> None:
         """
         Initialize the main application window and start the mainloop.
@@ -52,8 +65,10 @@ class MainApplication:
             width (int): Desired window width.
             height (int): Desired window height.
         """
-        screen_width = self.win.winfo_screenwidth()
-        screen_height = self.win.winfo_screenheight()
+        cls = type(self)
+        if cls._screen_size is None:
+            cls._screen_size = (self.win.winfo_screenwidth(), self.win.winfo_screenheight())
+        screen_width, screen_height = cls._screen_size
         x = (screen_width - width) // 3
         y = (screen_height - height) // 2
         self.win.geometry(f"{width}x{height}+{x}+{y}")
@@ -67,39 +82,53 @@ class MainApplication:
 
     def _create_pages(self) -> None:
         """
-        Instantiate each tab view and add to the notebook.
+        Add an empty placeholder frame per tab and build the first tab's view.
         """
-        self.member_page = MemberView(self.notebook)
-        self.notebook.add(self.member_page, text="Members")
-
-        self.book_page = BookView(self.notebook)
-        self.notebook.add(self.book_page, text="Books")
+        self._placeholders: Dict[str, ttk.Frame] = {}
+        self._pages: Dict[str, ttk.Frame] = {}
+        for tab_text in self._PAGES:
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=tab_text)
+            self._placeholders[tab_text] = placeholder
+        self._page("Members")
+
+    def _page(self, tab_text: str) -> ttk.Frame:
+        """
+        Return the view of a tab, building it inside its placeholder on first use.
 
-        self.borrow_page = BorrowView(self.notebook)
-        self.notebook.add(self.borrow_page, text="Borrows")
+        Args:
+            tab_text (str): Text of the tab, e.g. "Books".
 
-        self.report_page = ReportView(self.notebook)
-        self.notebook.add(self.report_page, text="Reports")
+        Returns:
+            ttk.Frame: The tab's view.
+        """
+        page = self._pages.get(tab_text)
+        if page is None:
+            page = self._PAGES[tab_text](self._placeholders[tab_text])
+            page.pack(fill="both", expand=True)
+            self._pages[tab_text] = page
+        return page
 
     def _on_tab_changed(self, event) -> None:
         """
-        Automatically focus the primary field/widget of each tab when switched.
+        Build the selected tab's view if needed and focus its primary field/widget.
 
         Args:
             event: The event object from <<NotebookTabChanged>>.
         """
         current_tab = self.notebook.select()
         tab_text = self.notebook.tab(current_tab, "text")
+        page = self._page(tab_text)
 
         # Set logical focus based on selected tab
         if tab_text == "Members":
-            self.win.after(100, self.member_page.name.entry.focus_set)
+            self.win.after(100, page.name.entry.focus_set)
         elif tab_text == "Books":
-            self.win.after(100, self.book_page.title.entry.focus_set)
+            self.win.after(100, page.title.entry.focus_set)
         elif tab_text == "Borrows":
-            self.win.after(100, self.borrow_page.member.combo.focus_set)
+            self.win.after(100, page.member.combo.focus_set)
         elif tab_text == "Reports":
-            self.win.after(100, self.report_page.all_borrows_information.focus_set)
+            self.win.after(100, page.all_borrows_information.focus_set)
 
 
 if __name__ == "__main__":
@@ -11,8 +11,10 @@ Features:
 """
 
 import tkinter as tk
+from concurrent.futures import Future
+from functools import partial
 from tkinter import Button, ttk, messagebox as msg
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from controller.member_controller import (
     add_member,
@@ -20,6 +22,7 @@ from controller.member_controller import (
     remove_member_by_id,
     find_all_members,
 )
+from view._background import run_in_background
 from view.component import LabelAndEntry, Table
 
 
@@ -38,10 +41,14 @@ class MemberView(ttk.Frame):
             parent (tk.Widget): The container this frame is placed inside.
         """
         super().__init__(parent)
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        self._write_generation = 0  # Advanced by every local table patch
         self._create_input_fields()
         self._create_member_table()
         self._reset_form()
         self._create_action_buttons()
+        self.name.entry.focus_set()
 
     def _create_input_fields(self) -> None:
         """Create input widgets for ID, Name, and Family fields."""
@@ -78,24 +85,18 @@ class MemberView(ttk.Frame):
         )
 
     def _create_member_table(self) -> None:
-        """Create the table to display all current members."""
-        status, result = find_all_members()
-        member_list = result if status else []
-
+        """Create the (initially empty) table; _reset_form fills it in the background."""
         self.member_table = Table(
             parent=self,
             headings=["ID", "Name", "Family"],
             column_widths=[30, 230, 230],
             x=270,
             y=20,
-            data=member_list,
+            data=[],
             on_double_click=self._load_selected_member,
             table_height=10,
         )
 
-        if not status:
-            msg.showerror("Load Error", f"Could not load members: {result}")
-
     def _load_selected_member(self, values: Tuple[str, str, str]) -> None:
         """
         Populate input fields from selected row.
@@ -111,39 +112,73 @@ class MemberView(ttk.Frame):
             msg.showerror("Load Error", f"Invalid data selection: {e}")
 
     def _refresh_table_data(self) -> None:
-        """Reload the table with updated data."""
-        status, result = find_all_members()
-        if status:
+        """
+        Reload the table with updated data without blocking the GUI.
+
+        The query runs on a worker thread; a request made while one is running
+        is coalesced into a single follow-up refresh. The controller cache is
+        bypassed, so changes made by other clients show up too.
+        """
+        if self._refresh_in_flight:
+            self._refresh_pending = True
+            return
+        self._refresh_in_flight = True
+        run_in_background(
+            self,
+            partial(find_all_members, reload=True),
+            partial(self._show_fetched, self._write_generation),
+        )
+
+    def _show_fetched(self, generation: int, future: Future) -> None:
+        """
+        Tk thread: apply a fetched result and start any refresh queued meanwhile.
+
+        A result fetched before a local save/edit/delete patched the table is
+        dropped and fetched again, so it cannot undo that change.
+        """
+        try:
+            status, result = future.result()
+        except Exception as e:  # Anything controller_op did not turn into (False, msg)
+            status, result = False, str(e)
+        finally:
+            self._refresh_in_flight = False
+        if status and generation != self._write_generation:
+            self._refresh_pending = True
+        elif status:
             self.member_table.update_data(result)
         else:
             msg.showerror("Refresh Error", f"Could not refresh data: {result}")
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_table_data()
 
     def _reset_form(self) -> None:
         """Clear form and refresh member list."""
+        self._clear_form()
+        self._refresh_table_data()
+
+    def _clear_form(self) -> None:
+        """Clear the input fields, leaving the table as it is."""
         self.id.variable.set(0)
         self.name.variable.set("")
         self.family.variable.set("")
-        self._refresh_table_data()
-        self.name.entry.focus_set()
 
     def _create_action_buttons(self) -> None:
         """Add action buttons: Save, Edit, Delete, Refresh."""
         btn_y = 220
-        btn_x_distance = 80
-        btn_y_distance = 30
         btn_width = 9
 
-        Button(self, text="Save", command=self.save_click, width=btn_width).place(
-            x=20, y=btn_y
-        )
-        Button(self, text="Edit", command=self.edit_click, width=btn_width).place(
-            x=20 + btn_x_distance, y=btn_y
-        )
-        Button(self, text="Delete", command=self.delete_click, width=btn_width).place(
-            x=20 + 2 * btn_x_distance, y=btn_y
-        )
-        Button(self, text="Refresh", command=self._reset_form, width=32).place(
-            x=20, y=btn_y + btn_y_distance
+        # One placed frame laid out by grid, instead of four separately placed buttons
+        btn_frame = ttk.Frame(self)
+        btn_frame.place(x=20, y=btn_y)
+        for column, (text, command) in enumerate(
+            [("Save", self.save_click), ("Edit", self.edit_click), ("Delete", self.delete_click)]
+        ):
+            Button(btn_frame, text=text, command=command, width=btn_width).grid(
+                row=0, column=column, padx=(0, 4), pady=(0, 4)
+            )
+        Button(btn_frame, text="Refresh", command=self._reset_form).grid(
+            row=1, column=0, columnspan=3, sticky="ew", padx=(0, 4)
         )
 
     def save_click(self) -> None:
@@ -154,8 +189,10 @@ class MemberView(ttk.Frame):
 
         status, result = add_member(*member)
         if status:
+            self._write_generation += 1  # Before the dialog: its event loop may apply a fetch
             msg.showinfo("Success", "Member saved successfully.")
-            self._reset_form()
+            self.member_table.insert_row(result.to_tuple())
+            self._clear_form()
         else:
             msg.showerror("Save Error", f"Could not save member: {result}")
 
@@ -172,8 +209,10 @@ class MemberView(ttk.Frame):
 
         status, result = edit_member(member_id, *member)
         if status:
+            self._write_generation += 1
             msg.showinfo("Success", "Member updated successfully.")
-            self._reset_form()
+            self.member_table.update_row(result.to_tuple())
+            self._clear_form()
         else:
             msg.showerror("Edit Error", f"Could not edit member: {result}")
 
@@ -186,8 +225,10 @@ class MemberView(ttk.Frame):
 
         status, result = remove_member_by_id(member_id)
         if status:
+            self._write_generation += 1
             msg.showinfo("Success", "Member deleted successfully.")
-            self._reset_form()
+            self.member_table.delete_row(member_id)
+            self._clear_form()
         else:
             msg.showerror("Delete Error", f"Could not delete member: {result}")
 
@@ -201,11 +242,13 @@ class MemberView(ttk.Frame):
         name = self.name.variable.get().strip()
         family = self.family.variable.get().strip()
 
+        errors: List[str] = []
         if not name:
-            msg.showerror("Validation Error", "Name is required!")
-            return None
+            errors.append("Name is required!")
         if not family:
-            msg.showerror("Validation Error", "Family is required!")
+            errors.append("Family is required!")
+        if errors:
+            msg.showerror("Validation Error", "\n".join(errors))
             return None
 
         return name, family
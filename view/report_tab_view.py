@@ -6,14 +6,18 @@ various analytical and operational reports in the library system.
 
 Reports are presented in separate pop-up windows using a table view.
 Each button generates a specific report by calling the report controller.
+Report queries run on a worker thread, so the GUI stays responsive meanwhile.
 """
 
-from tkinter import Button, Toplevel
+from concurrent.futures import Future
+from functools import partial
+from tkinter import Button, Toplevel, messagebox as msg
 from tkinter import ttk
 from tkinter.ttk import Label
 from controller import report_controller
+from view._background import run_in_background
 from view.component import Table
-from typing import List, Tuple
+from typing import Callable, Dict, List, Set, Tuple
 
 
 class ReportView(ttk.Frame):
@@ -32,6 +36,9 @@ class ReportView(ttk.Frame):
             master: The parent widget/container (typically a notebook tab).
         """
         super().__init__(master)
+        self._loading: Set[str] = set()  # Titles of reports whose query is running
+        # Report title -> its window and table; closing a window only hides it
+        self._report_windows: Dict[str, Tuple[Toplevel, Table]] = {}
         self._build()
 
     def _build(self) -> None:
@@ -40,55 +47,26 @@ class ReportView(ttk.Frame):
             pady=(10, 20)
         )
 
-        self.all_borrows_information = Button(
-            self,
-            text="All Borrows Information",
-            font=("Segoe UI", 10),
-            command=self.report_all_borrows,
-        )
-        self.all_borrows_information.pack(fill="x", padx=20, pady=4)
-
-        Button(
-            self,
-            text="Books Currently Borrowed",
-            font=("Segoe UI", 10),
-            command=self.report_borrowed_books,
-        ).pack(fill="x", padx=20, pady=4)
-
-        Button(
-            self,
-            text="Books Never Borrowed",
-            font=("Segoe UI", 10),
-            command=self.report_never_borrowed_books,
-        ).pack(fill="x", padx=20, pady=4)
-
-        Button(
-            self,
-            text="Members With Unreturned Books",
-            font=("Segoe UI", 10),
-            command=self.report_members_with_unreturned,
-        ).pack(fill="x", padx=20, pady=4)
-
-        Button(
-            self,
-            text="Members Who Never Borrowed",
-            font=("Segoe UI", 10),
-            command=self.report_members_never_borrowed,
-        ).pack(fill="x", padx=20, pady=4)
-
-        Button(
-            self,
-            text="Borrow Times per Book",
-            font=("Segoe UI", 10),
-            command=self.book_borrow_counts,
-        ).pack(fill="x", padx=20, pady=4)
+        buttons = [
+            Button(self, text=text, font=("Segoe UI", 10), command=command)
+            for text, command in (
+                ("All Borrows Information", self.report_all_borrows),
+                ("Books Currently Borrowed", self.report_borrowed_books),
+                ("Books Never Borrowed", self.report_never_borrowed_books),
+                ("Members With Unreturned Books", self.report_members_with_unreturned),
+                ("Members Who Never Borrowed", self.report_members_never_borrowed),
+                ("Borrow Times per Book", self.book_borrow_counts),
+            )
+        ]
+        for button in buttons:
+            button.pack(fill="x", padx=20, pady=4)
+        self.all_borrows_information = buttons[0]
 
     def report_all_borrows(self) -> None:
         """Generate report: all historical borrow transactions."""
-        data = report_controller.get_report_all_borrows_info()
-        self._create_report_window(
+        self._load_report(
+            report_controller.get_report_all_borrows_info,
             title="All Borrow Records",
-            data=data,
             column_widths=[70, 150, 150, 70, 150, 150, 150, 150],
             headings=[
                 "Book ID",
@@ -104,10 +82,9 @@ class ReportView(ttk.Frame):
 
     def report_borrowed_books(self) -> None:
         """Generate report: books currently borrowed."""
-        data = report_controller.get_currently_borrowed_info()
-        self._create_report_window(
+        self._load_report(
+            report_controller.get_currently_borrowed_info,
             title="Books Currently Borrowed",
-            data=data,
             column_widths=[70, 150, 70, 150, 150, 150],
             headings=[
                 "Book ID",
@@ -121,20 +98,18 @@ class ReportView(ttk.Frame):
 
     def report_never_borrowed_books(self) -> None:
         """Generate report: books that have never been borrowed."""
-        data = report_controller.get_books_never_borrowed_info()
-        self._create_report_window(
+        self._load_report(
+            report_controller.get_books_never_borrowed_info,
             title="Books Never Borrowed",
-            data=data,
             column_widths=[70, 150, 150],
             headings=["Book ID", "Title", "Author"],
         )
 
     def report_members_with_unreturned(self) -> None:
         """Generate report: members with books not returned yet."""
-        data = report_controller.get_members_with_unreturned_info()
-        self._create_report_window(
+        self._load_report(
+            report_controller.get_members_with_unreturned_info,
             title="Members With Unreturned Books",
-            data=data,
             column_widths=[70, 150, 150, 150, 150],
             headings=[
                 "Member ID",
@@ -147,20 +122,18 @@ class ReportView(ttk.Frame):
 
     def report_members_never_borrowed(self) -> None:
         """Generate report: members who have never borrowed a book."""
-        data = report_controller.get_members_never_borrowed_info()
-        self._create_report_window(
+        self._load_report(
+            report_controller.get_members_never_borrowed_info,
             title="Members Who Never Borrowed",
-            data=data,
             column_widths=[70, 150, 150],
             headings=["Member ID", "First Name", "Last Name"],
         )
 
     def book_borrow_counts(self) -> None:
         """Generate report: how many times each book has been borrowed."""
-        data = report_controller.get_book_borrow_counts_info()
-        self._create_report_window(
+        self._load_report(
+            report_controller.get_book_borrow_counts_info,
             title="Borrow Times per Book",
-            data=data,
             column_widths=[70, 150, 150, 150],
             headings=[
                 "Book ID",
@@ -170,6 +143,50 @@ class ReportView(ttk.Frame):
             ],
         )
 
+    def _load_report(
+        self,
+        loader: Callable[[], List[Tuple]],
+        title: str,
+        column_widths: List[int],
+        headings: List[str],
+    ) -> None:
+        """
+        Run a report query on a worker thread and show the result when it arrives.
+
+        Clicks on a report whose query is still running are ignored.
+
+        Args:
+            loader (Callable[[], List[Tuple]]): Report controller function.
+            title (str): Title of the window.
+            column_widths (List[int]): Column widths in pixels.
+            headings (List[str]): Column headers.
+        """
+        if title in self._loading:
+            return
+        self._loading.add(title)
+        run_in_background(
+            self, loader, partial(self._show_report, title, column_widths, headings)
+        )
+
+    def _show_report(
+        self,
+        title: str,
+        column_widths: List[int],
+        headings: List[str],
+        future: Future,
+    ) -> None:
+        """Tk thread: open the window for a fetched report, or show why it failed."""
+        try:
+            data = future.result()
+        except Exception as e:
+            msg.showerror("Report Error", f"Could not load report: {e}")
+            return
+        finally:
+            self._loading.discard(title)
+        self._create_report_window(
+            title=title, data=data, column_widths=column_widths, headings=headings
+        )
+
     def _create_report_window(
         self,
         title: str,
@@ -178,7 +195,10 @@ class ReportView(ttk.Frame):
         headings: List[str],
     ) -> None:
         """
-        Helper method to display a new window with a Table of report data.
+        Helper method to display a window with a Table of report data.
+
+        Each report gets one window, built on first use. Later runs refill its
+        table and bring it back to the front instead of building new widgets.
 
         Args:
             title (str): Title of the window.
@@ -186,8 +206,17 @@ class ReportView(ttk.Frame):
             column_widths (List[int]): Column widths in pixels.
             headings (List[str]): Column headers.
         """
+        existing = self._report_windows.get(title)
+        if existing is not None and existing[0].winfo_exists():
+            window, table = existing
+            table.update_data(data)
+            window.deiconify()
+            window.lift()
+            return
+
         window = Toplevel()
         window.title(title)
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
 
         table = Table(
             parent=window,
@@ -200,9 +229,4 @@ class ReportView(ttk.Frame):
             table_height=20,
         )
         table.container.pack(padx=10, pady=10, fill="both", expand=True)
-
-        # Resize window based on content size
-        window.update_idletasks()
-        window.geometry(
-            f"{table.container.winfo_reqwidth()}x{table.container.winfo_reqheight()}"
-        )
+        self._report_windows[title] = (window, table)